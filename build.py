@@ -0,0 +1,52 @@
+"""선택적 Cython 빌드 스크립트
+
+Cython이 설치되어 있으면 핫패스 모듈(LLM 출력 파서)을 확장 모듈로 컴파일합니다.
+컴파일된 확장(.so)이 없으면 기존 순수 Python 모듈이 그대로 import 됩니다.
+
+src/core/models.py는 대상에서 제외합니다. Cython이 메서드를 cyfunction으로 바꾸면
+Pydantic이 이를 어노테이션 없는 필드로 인식해 모델 클래스 생성이 실패합니다.
+
+Usage:
+    $ pip install cython
+    $ python build.py            # 제자리 빌드 (build_ext --inplace)
+"""
+
+import sys
+from typing import Any, Dict, List
+
+# 컴파일 대상 모듈
+CYTHON_MODULES = [
+    "src/generation/parser.py",
+]
+
+COMPILER_DIRECTIVES = {
+    "language_level": 3,
+    "boundscheck": False,
+    "wraparound": False,
+}
+
+
+def get_ext_modules() -> List[Any]:
+    """Cython 확장 모듈 목록 (Cython 미설치 시 빈 리스트)"""
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("Cython not installed: skipping compilation (pure Python fallback)")
+        return []
+
+    return cythonize(CYTHON_MODULES, compiler_directives=COMPILER_DIRECTIVES)
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    """Poetry 빌드 훅"""
+    setup_kwargs.update({"ext_modules": get_ext_modules()})
+
+
+if __name__ == "__main__":
+    from setuptools import setup
+
+    setup(
+        name="poc-api-spec-rag",
+        ext_modules=get_ext_modules(),
+        script_args=sys.argv[1:] or ["build_ext", "--inplace"],
+    )
@@ -0,0 +1,58 @@
+"""CLI 콜드 스타트 단축용 백그라운드 import
+
+명령어가 나중에 필요로 하는 무거운 모듈을 데몬 스레드에서 미리 import 합니다.
+메인 스레드가 파싱이나 Ollama 요청을 기다리는 동안 import가 진행되므로,
+실제로 필요한 시점의 import는 sys.modules 조회로 끝납니다.
+"""
+
+import importlib
+import threading
+from typing import Optional
+
+# 명령어별 미리 import 할 모듈 (메인 스레드가 먼저 쓰는 모듈은 제외)
+_COMMAND_MODULES = {
+    "ingest": (
+        "chromadb",
+        "ollama",
+        "src.ingestion.embedder",
+        "src.ingestion.indexer",
+    ),
+    "query": (
+        "src.generation",
+        "src.generation.llm_client",
+        "src.validation",
+    ),
+}
+
+_thread: Optional[threading.Thread] = None
+
+
+def start(command: Optional[str]) -> None:
+    """명령어에 필요한 모듈을 백그라운드에서 import 시작
+
+    Args:
+        command: 실행할 CLI 명령어 이름 (대상이 아니면 아무것도 하지 않음)
+    """
+    global _thread
+
+    modules = _COMMAND_MODULES.get(command or "")
+    if not modules or _thread is not None:
+        return
+
+    _thread = threading.Thread(target=_warmup, args=(modules,), name="import-warmup", daemon=True)
+    _thread.start()
+
+
+def wait() -> None:
+    """백그라운드 import 완료 대기 (fork 전에 호출해 import 락을 쥔 채 fork 되지 않도록)"""
+    if _thread is not None:
+        _thread.join()
+
+
+def _warmup(modules) -> None:
+    """모듈 import (실패는 무시: 실제 사용 시점에 원래 오류가 다시 발생)"""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
@@ -21,6 +21,7 @@ from .models import (
     GenerationRequest,
     GenerationResponse,
     # Validation Models
+    CurlComponents,
     ValidationResult,
     ValidationError,
     ConfidenceScore,
@@ -28,7 +29,7 @@ from .models import (
     PipelineRequest,
     PipelineResponse,
 )
-from .config import settings, Settings
+from .config import settings, Settings, get_settings, bootstrap
 from .exceptions import (
     APISpecRAGError,
     SpecParsingError,
@@ -58,6 +59,7 @@ __all__ = [
     "CurlCommand",
     "GenerationRequest",
     "GenerationResponse",
+    "CurlComponents",
     "ValidationResult",
     "ValidationError",
     "ConfidenceScore",
@@ -66,6 +68,8 @@ __all__ = [
     # Config
     "settings",
     "Settings",
+    "get_settings",
+    "bootstrap",
     # Exceptions
     "APISpecRAGError",
     "SpecParsingError",
@@ -0,0 +1,41 @@
+"""이벤트 루프별 Ollama 비동기 클라이언트"""
+
+import asyncio
+import weakref
+from typing import Any
+
+
+class LoopLocalAsyncClient:
+    """실행 중인 이벤트 루프마다 ollama.AsyncClient 하나를 만들어 재사용
+
+    httpx 비동기 커넥션 풀은 생성된 이벤트 루프에서만 쓸 수 있으므로 루프별로 보관합니다.
+    서버처럼 하나의 루프에서 요청을 동시에 처리하면 모든 요청이 같은 커넥션 풀을 공유합니다.
+    """
+
+    def __init__(self, host: str, timeout: float):
+        """
+        Args:
+            host: Ollama 서버 주소
+            timeout: 요청 타임아웃 (초)
+        """
+        self.host = host
+        self.timeout = timeout
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> Any:
+        """현재 이벤트 루프의 클라이언트 반환 (없으면 생성)
+
+        Returns:
+            ollama.AsyncClient: 현재 루프에 묶인 클라이언트
+
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프가 없을 때
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            import ollama
+            client = self._clients[loop] = ollama.AsyncClient(host=self.host, timeout=self.timeout)
+        return client
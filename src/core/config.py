@@ -1,9 +1,10 @@
 """프로젝트 설정 관리"""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
-from pydantic import ConfigDict
+from pydantic import ConfigDict, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -26,8 +27,13 @@ class Settings(BaseSettings):
     # Ollama 설정
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_EMBEDDING_MODEL: str = "nomic-embed-text"
+    OLLAMA_EMBEDDING_DIM: Optional[int] = None  # 알고 있으면 지정 (차원 확인용 임베딩 요청 생략)
     OLLAMA_LLM_MODEL: str = "gpt-oss:20b"
     OLLAMA_TIMEOUT: int = 120  # seconds
+    OLLAMA_KEEP_ALIVE: str = "10m"  # 마지막 요청 후 모델을 메모리에 유지할 시간 (Ollama 기본값 5m)
+    OLLAMA_EMBED_BATCH_SIZE: int = 32  # /api/embed 1회 요청당 텍스트 수 (GPU 환경은 128 권장)
+    OLLAMA_EMBED_MAX_CHARS: int = 150_000  # /api/embed 1회 요청당 총 문자 수
+    OLLAMA_CONCURRENCY: int = 2  # 동시 임베딩 요청 수 (서버의 OLLAMA_NUM_PARALLEL에 맞춤)
 
     # ChromaDB 설정
     CHROMA_COLLECTION_NAME: str = "api_spec_endpoints"
@@ -37,6 +43,14 @@ class Settings(BaseSettings):
     TOP_K: int = 5  # 검색할 청크 개수
     SIMILARITY_THRESHOLD: float = 0.5  # 최소 유사도 임계값
     HIGH_CONFIDENCE_THRESHOLD: float = 0.7  # 고신뢰도 임계값
+    RERANK_SKIP_GAP: float = 0.15  # 1, 2위 유사도 차이가 이 이상이면 LLM 재정렬 생략
+
+    # 질의 캐시 설정 (질의 임베딩 / 검색 결과)
+    QUERY_CACHE_SIZE: int = 256  # 캐시별 최대 항목 수 (0이면 캐시 안 함)
+    QUERY_CACHE_TTL: int = 3600  # seconds (0이면 만료 없음)
+
+    # 검증 설정
+    VALIDATION_REGEX_ENGINE: str = "re"  # "re2"이면 google-re2 사용 (선형 시간 보장, 짧은 입력은 더 느림)
 
     # LLM 생성 설정
     LLM_TEMPERATURE: float = 0.1  # 낮을수록 deterministic
@@ -46,6 +60,24 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    @field_validator("OLLAMA_EMBED_BATCH_SIZE")
+    @classmethod
+    def _clamp_embed_batch_size(cls, value: int) -> int:
+        """임베딩 배치 크기를 1~1024로 제한"""
+        return min(max(value, 1), 1024)
+
+    @field_validator("OLLAMA_EMBED_MAX_CHARS")
+    @classmethod
+    def _clamp_embed_max_chars(cls, value: int) -> int:
+        """임베딩 요청당 문자 수를 1,000~10,000,000으로 제한"""
+        return min(max(value, 1_000), 10_000_000)
+
+    @field_validator("OLLAMA_CONCURRENCY")
+    @classmethod
+    def _clamp_concurrency(cls, value: int) -> int:
+        """동시 임베딩 요청 수를 1~32로 제한"""
+        return min(max(value, 1), 32)
+
     def ensure_directories(self):
         """필요한 디렉토리 생성"""
         for dir_path in [
@@ -57,8 +89,22 @@ class Settings(BaseSettings):
             dir_path.mkdir(parents=True, exist_ok=True)
 
 
-# 전역 설정 인스턴스
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 반환 (.env는 최초 1회만 파싱)"""
+    return Settings()
+
+
+def bootstrap() -> Settings:
+    """실행 진입점(CLI 등)에서 호출: 필요한 디렉토리 생성 후 설정 반환"""
+    config = get_settings()
+    config.ensure_directories()
+    return config
+
+
+# 전역 설정 인스턴스 (하위 호환)
+settings = get_settings()
 
-# 디렉토리 생성
-settings.ensure_directories()
+# 디렉토리 생성은 진입점의 bootstrap()에서 수행 (APISPEC_BOOTSTRAP 설정 시 import 시점에 수행)
+if os.environ.get("APISPEC_BOOTSTRAP"):
+    bootstrap()
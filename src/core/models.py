@@ -1,15 +1,55 @@
 """Pydantic 모델 정의"""
 
-from typing import Any, Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+import functools
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# dataclass slots 옵션 (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# 반복 등장하는 문자열 상수 (청크마다 같은 객체를 공유하도록 intern)
+_METHOD_INTERN = {
+    m: sys.intern(m)
+    for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD")
+}
+_PARAM_IN_INTERN = {loc: sys.intern(loc) for loc in ("query", "header", "path", "cookie")}
+
+
+# 경로 파라미터 (예: {payment_id})
+_PATH_PARAM_RE = re.compile(r"\{[^}]+\}")
+
+
+def _intern_method(value: Any) -> Any:
+    """HTTP 메서드를 대문자 intern 문자열로 변환"""
+    if not isinstance(value, str):
+        return value
+    upper = value.upper()
+    return _METHOD_INTERN.get(upper) or sys.intern(upper)
+
+
+def _construct(model_cls, value):
+    """신뢰할 수 있는 값을 검증 없이 모델로 변환 (이미 인스턴스이거나 None이면 그대로)"""
+    if value is None or isinstance(value, model_cls):
+        return value
+    return model_cls.model_construct(**value)
 
 
 # ============================================================================
 # OpenAPI Specification Models
 # ============================================================================
 
+# 인제스트 시 한 번 생성 후 변경하지 않는 명세 모델 공통 설정
+_SPEC_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+
 class Schema(BaseModel):
     """OpenAPI Schema 객체"""
+    model_config = _SPEC_MODEL_CONFIG
+
     type: Optional[str] = None
     format: Optional[str] = None
     description: Optional[str] = None
@@ -23,6 +63,8 @@ class Schema(BaseModel):
 
 class Parameter(BaseModel):
     """OpenAPI Parameter 객체"""
+    model_config = _SPEC_MODEL_CONFIG
+
     name: str
     in_: Literal["query", "header", "path", "cookie"] = Field(..., alias="in")
     description: Optional[str] = None
@@ -30,9 +72,25 @@ class Parameter(BaseModel):
     schema_: Optional[Schema] = Field(None, alias="schema")
     example: Optional[Any] = None
 
+    @field_validator("in_", mode="before")
+    @classmethod
+    def _intern_in(cls, value: Any) -> Any:
+        """파라미터 위치 문자열 intern"""
+        return _PARAM_IN_INTERN.get(value, value)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Parameter":
+        """신뢰할 수 있는 내부 데이터(by_alias 직렬화 결과)로 검증 없이 생성"""
+        data = dict(data)
+        data["in"] = _PARAM_IN_INTERN.get(data.get("in"), data.get("in"))
+        data["schema"] = _construct(Schema, data.get("schema"))
+        return cls.model_construct(**data)
+
 
 class RequestBody(BaseModel):
     """OpenAPI RequestBody 객체"""
+    model_config = _SPEC_MODEL_CONFIG
+
     description: Optional[str] = None
     content: Dict[str, Any]  # media type -> schema
     required: Optional[bool] = False
@@ -40,12 +98,16 @@ class RequestBody(BaseModel):
 
 class Response(BaseModel):
     """OpenAPI Response 객체"""
+    model_config = _SPEC_MODEL_CONFIG
+
     description: str
     content: Optional[Dict[str, Any]] = None  # media type -> schema
 
 
 class Operation(BaseModel):
     """OpenAPI Operation 객체 (GET, POST 등)"""
+    model_config = _SPEC_MODEL_CONFIG
+
     summary: Optional[str] = None
     description: Optional[str] = None
     operationId: Optional[str] = None
@@ -55,9 +117,32 @@ class Operation(BaseModel):
     responses: Dict[str, Response]
     security: Optional[List[Dict[str, List[str]]]] = None
 
+    @field_validator("responses", mode="before")
+    @classmethod
+    def _intern_status_codes(cls, value: Any) -> Any:
+        """상태 코드 키 intern (YAML의 숫자 키도 문자열로 변환)"""
+        if isinstance(value, dict):
+            return {sys.intern(str(code)): response for code, response in value.items()}
+        return value
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Operation":
+        """신뢰할 수 있는 명세서 데이터로 검증 없이 생성 (하위 객체까지)"""
+        data = dict(data)
+        if data.get("parameters"):
+            data["parameters"] = [Parameter.from_trusted(p) for p in data["parameters"]]
+        data["requestBody"] = _construct(RequestBody, data.get("requestBody"))
+        data["responses"] = {
+            sys.intern(str(code)): _construct(Response, response)
+            for code, response in (data.get("responses") or {}).items()
+        }
+        return cls.model_construct(**data)
+
 
 class PathItem(BaseModel):
     """OpenAPI Path Item (경로별 엔드포인트)"""
+    model_config = _SPEC_MODEL_CONFIG
+
     get: Optional[Operation] = None
     post: Optional[Operation] = None
     put: Optional[Operation] = None
@@ -66,6 +151,16 @@ class PathItem(BaseModel):
     options: Optional[Operation] = None
     head: Optional[Operation] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "PathItem":
+        """신뢰할 수 있는 명세서 데이터로 검증 없이 생성 (하위 객체까지)"""
+        operations = {
+            method: Operation.from_trusted(data[method])
+            for method in cls.model_fields
+            if data.get(method) is not None
+        }
+        return cls.model_construct(**operations)
+
 
 class OpenAPISpec(BaseModel):
     """OpenAPI Specification (전체 구조)"""
@@ -75,13 +170,29 @@ class OpenAPISpec(BaseModel):
     paths: Dict[str, PathItem]
     components: Optional[Dict[str, Any]] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "OpenAPISpec":
+        """신뢰할 수 있는 명세서(이미 검증된 내부 명세 등)로 검증 없이 생성"""
+        data = dict(data)
+        data["paths"] = {
+            path: PathItem.from_trusted(item)
+            for path, item in (data.get("paths") or {}).items()
+        }
+        return cls.model_construct(**data)
+
 
 # ============================================================================
 # RAG Chunking Models
 # ============================================================================
 
+# 청크 모델 공통 설정 (생성 후 불변, 정의되지 않은 필드 거부)
+_CHUNK_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class ChunkMetadata(BaseModel):
     """청크 메타데이터"""
+    model_config = _CHUNK_MODEL_CONFIG
+
     endpoint: str  # "/api/v1/payment/approve"
     method: str  # "POST", "GET", etc.
     tags: List[str] = Field(default_factory=list)
@@ -89,9 +200,34 @@ class ChunkMetadata(BaseModel):
     requires_auth: bool = False
     content_type: Optional[str] = None
 
+    @field_validator("method", mode="before")
+    @classmethod
+    def _intern_method(cls, value: Any) -> Any:
+        """HTTP 메서드 intern"""
+        return _intern_method(value)
+
+    def __hash__(self) -> int:
+        return hash((self.endpoint, self.method))
+
+    @functools.cached_property
+    def normalized_endpoint(self) -> str:
+        """경로 파라미터를 제거한 엔드포인트 (예: /payment/{id} → /payment/), 첫 접근 시 한 번만 계산"""
+        if "{" not in self.endpoint:
+            return self.endpoint
+        return _PATH_PARAM_RE.sub("", self.endpoint)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ChunkMetadata":
+        """신뢰할 수 있는 내부 데이터로 검증 없이 생성"""
+        data = dict(data)
+        data["method"] = _intern_method(data.get("method"))
+        return cls.model_construct(**data)
+
 
 class EndpointChunk(BaseModel):
     """엔드포인트 청크 (벡터 저장 단위)"""
+    model_config = _CHUNK_MODEL_CONFIG
+
     chunk_id: str  # "POST_/api/v1/payment/approve"
     method: str
     path: str
@@ -101,9 +237,47 @@ class EndpointChunk(BaseModel):
     request_body: Optional[RequestBody] = None
     responses: Dict[str, Response]
     metadata: ChunkMetadata
+    embedding_text: Optional[str] = None  # to_embedding_text() 결과 캐시
+
+    @field_validator("method", mode="before")
+    @classmethod
+    def _intern_method(cls, value: Any) -> Any:
+        """HTTP 메서드 intern"""
+        return _intern_method(value)
+
+    def __hash__(self) -> int:
+        return hash(self.chunk_id)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "EndpointChunk":
+        """신뢰할 수 있는 내부 데이터(ChromaDB, 자체 생성 청크)로 검증 없이 생성"""
+        data = dict(data)
+        data["method"] = _intern_method(data.get("method"))
+        if isinstance(data.get("metadata"), dict):
+            data["metadata"] = ChunkMetadata.from_trusted(data["metadata"])
+        data["request_body"] = _construct(RequestBody, data.get("request_body"))
+        if data.get("parameters"):
+            data["parameters"] = [
+                Parameter.from_trusted(p) if isinstance(p, dict) else p
+                for p in data["parameters"]
+            ]
+        if data.get("responses"):
+            data["responses"] = {
+                code: _construct(Response, response)
+                for code, response in data["responses"].items()
+            }
+        return cls.model_construct(**data)
+
+    @functools.cached_property
+    def required_param_names(self) -> Tuple[str, ...]:
+        """필수 파라미터 이름 (청크는 불변이므로 첫 접근 시 한 번만 계산)"""
+        return tuple(p.name for p in self.parameters or () if p.required)
 
     def to_embedding_text(self) -> str:
-        """임베딩용 텍스트 생성"""
+        """임베딩용 텍스트 생성 (첫 호출 결과를 embedding_text에 캐시)"""
+        if self.embedding_text is not None:
+            return self.embedding_text
+
         parts = [
             f"{self.method} {self.path}",
         ]
@@ -121,7 +295,9 @@ class EndpointChunk(BaseModel):
         if self.metadata.tags:
             parts.append(f"Tags: {', '.join(self.metadata.tags)}")
 
-        return "\n".join(parts)
+        # frozen 모델이므로 캐시 필드는 우회해서 기록
+        object.__setattr__(self, "embedding_text", "\n".join(parts))
+        return self.embedding_text
 
 
 # ============================================================================
@@ -141,6 +317,15 @@ class RetrievalResult(BaseModel):
     similarity_score: float = Field(..., ge=0.0, le=1.0)
     rank: int  # 1-based ranking
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "RetrievalResult":
+        """신뢰할 수 있는 내부 데이터로 검증 없이 생성"""
+        data = dict(data)
+        chunk = data.get("chunk")
+        if isinstance(chunk, dict):
+            data["chunk"] = EndpointChunk.from_trusted(chunk)
+        return cls.model_construct(**data)
+
 
 class RetrievalResponse(BaseModel):
     """검색 응답"""
@@ -148,6 +333,16 @@ class RetrievalResponse(BaseModel):
     query: str
     total_results: int
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "RetrievalResponse":
+        """신뢰할 수 있는 내부 데이터로 검증 없이 생성"""
+        data = dict(data)
+        data["results"] = [
+            RetrievalResult.from_trusted(r) if isinstance(r, dict) else r
+            for r in data.get("results", [])
+        ]
+        return cls.model_construct(**data)
+
 
 # ============================================================================
 # Generation Models
@@ -176,23 +371,43 @@ class GenerationResponse(BaseModel):
     confidence: Literal["high", "medium", "low"]
     warnings: List[str] = Field(default_factory=list)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "GenerationResponse":
+        """신뢰할 수 있는 내부 데이터(파서 출력)로 검증 없이 생성"""
+        data = dict(data)
+        data["curl_command"] = _construct(CurlCommand, data.get("curl_command"))
+        return cls.model_construct(**data)
+
 
 # ============================================================================
 # Validation Models
 # ============================================================================
 
-class ValidationError(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class CurlComponents:
+    """cURL 명령어 구성 요소 (CurlValidator가 추출, 검증 캐시에서 공유하므로 불변)"""
+    method: str  # 대문자, -X가 없으면 GET
+    url: Optional[str]  # 실제 URL, 플레이스홀더 또는 환경변수 (없으면 None)
+    headers: Tuple[str, ...] = ()  # "Key: Value" 원문
+    body: Optional[str] = None  # 첫 번째 -d/--data/--data-raw 값
+    # 헤더 이름 (":" 앞, 소문자), headers에서 파생되므로 repr/비교에서 제외
+    header_names: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ValidationError:
     """검증 오류"""
     field: str
     message: str
     severity: Literal["error", "warning"]
 
 
-class ValidationResult(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class ValidationResult:
     """검증 결과"""
     valid: bool
-    errors: List[ValidationError] = Field(default_factory=list)
-    warnings: List[ValidationError] = Field(default_factory=list)
+    errors: List[ValidationError] = field(default_factory=list)
+    warnings: List[ValidationError] = field(default_factory=list)
 
     @property
     def has_errors(self) -> bool:
@@ -205,12 +420,21 @@ class ValidationResult(BaseModel):
         return len(self.warnings) > 0
 
 
-class ConfidenceScore(BaseModel):
+# 신뢰도 레벨 (인덱스 = 통과한 임계값 개수)
+_LEVELS = ("low", "medium", "high")
+
+# 신뢰도 가중치 (유사도, 명세 완성도, 검증 통과)
+_CONFIDENCE_WEIGHTS = (0.4, 0.3, 0.3)
+_W_SIMILARITY, _W_SPEC, _W_VALIDATION = _CONFIDENCE_WEIGHTS
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ConfidenceScore:
     """신뢰도 점수"""
-    similarity: float = Field(..., ge=0.0, le=1.0)
-    spec_completeness: float = Field(..., ge=0.0, le=1.0)
+    similarity: float  # 0.0 ~ 1.0
+    spec_completeness: float  # 0.0 ~ 1.0
     validation_passed: bool
-    overall: float = Field(..., ge=0.0, le=1.0)
+    overall: float  # 0.0 ~ 1.0
     level: Literal["high", "medium", "low"]
 
     @classmethod
@@ -222,17 +446,13 @@ class ConfidenceScore(BaseModel):
     ) -> "ConfidenceScore":
         """신뢰도 점수 계산"""
         overall = (
-            similarity * 0.4 +
-            spec_completeness * 0.3 +
-            (1.0 if validation_passed else 0.0) * 0.3
+            similarity * _W_SIMILARITY +
+            spec_completeness * _W_SPEC +
+            validation_passed * _W_VALIDATION
         )
 
-        if overall > 0.8:
-            level = "high"
-        elif overall > 0.6:
-            level = "medium"
-        else:
-            level = "low"
+        # 0.6 초과면 medium, 0.8 초과면 high
+        level = _LEVELS[(overall > 0.6) + (overall > 0.8)]
 
         return cls(
             similarity=similarity,
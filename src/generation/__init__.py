@@ -1,11 +1,22 @@
 """Generation 모듈 - cURL 명령어 생성"""
 
 from .prompt_builder import PromptBuilder
-from .llm_client import OllamaLLMClient
 from .parser import OutputParser
 
+# llm_client는 ollama를 import 하므로 처음 접근할 때 로드 (PEP 562)
+_LAZY_ATTRS = {"OllamaLLMClient", "get_llm_client"}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from . import llm_client
+        return getattr(llm_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "PromptBuilder",
     "OllamaLLMClient",
+    "get_llm_client",
     "OutputParser",
 ]
@@ -1,10 +1,24 @@
 """Ollama LLM 클라이언트"""
 
-import ollama
-from typing import Optional
+import functools
+import io
+from typing import Dict, Iterator, List, Optional
 
+from src.core.async_client import LoopLocalAsyncClient
 from src.core.config import settings
+from src.core.models import GenerationResponse
 from src.core.exceptions import GenerationError, OllamaConnectionError
+from src.generation.parser import OutputParser
+
+
+_default_client: Optional["OllamaLLMClient"] = None
+
+
+@functools.cache
+def _ollama():
+    """ollama 모듈 지연 import (파서/프롬프트만 쓰는 경로의 시작 시간 단축)"""
+    import ollama
+    return ollama
 
 
 class OllamaLLMClient:
@@ -19,6 +33,13 @@ class OllamaLLMClient:
         self.temperature = settings.LLM_TEMPERATURE
         self.max_tokens = settings.LLM_MAX_TOKENS
 
+        # 연결 재사용 (keep-alive 커넥션 풀)
+        self._client = _ollama().Client(
+            host=settings.OLLAMA_BASE_URL,
+            timeout=settings.OLLAMA_TIMEOUT
+        )
+        self._async_client = LoopLocalAsyncClient(settings.OLLAMA_BASE_URL, settings.OLLAMA_TIMEOUT)
+
     def generate(
         self,
         prompt: str,
@@ -39,39 +60,62 @@ class OllamaLLMClient:
         """
         try:
             # 메시지 구성
-            messages = []
-
-            if system_prompt:
-                messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+            messages = self._build_messages(prompt, system_prompt)
 
             # Ollama 호출
-            response = ollama.chat(
+            response = self._client.chat(
                 model=self.model,
                 messages=messages,
                 options={
                     "temperature": self.temperature,
                     "num_predict": self.max_tokens,
-                }
+                },
+                keep_alive=settings.OLLAMA_KEEP_ALIVE
+            )
+
+            return self._extract_text(response)
+
+        except ConnectionError as e:
+            raise OllamaConnectionError(
+                f"Failed to connect to Ollama: {e}. "
+                "Make sure Ollama is running (ollama serve)"
             )
+        except Exception as e:
+            raise GenerationError(f"Failed to generate text: {e}")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """텍스트 생성 (비동기)
 
-            # 응답 추출
-            if not response or "message" not in response:
-                raise GenerationError("No response from Ollama")
+        같은 이벤트 루프의 동시 요청은 하나의 커넥션 풀을 공유하므로
+        Ollama(OLLAMA_NUM_PARALLEL > 1)가 여러 요청을 함께 배치 처리할 수 있습니다.
 
-            generated_text = response["message"]["content"]
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
 
-            if not generated_text:
-                raise GenerationError("Empty response from Ollama")
+        Returns:
+            str: 생성된 텍스트
+
+        Raises:
+            GenerationError: 생성 실패 시
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        try:
+            response = await self._async_client.get().chat(
+                model=self.model,
+                messages=self._build_messages(prompt, system_prompt),
+                options={
+                    "temperature": self.temperature,
+                    "num_predict": self.max_tokens,
+                },
+                keep_alive=settings.OLLAMA_KEEP_ALIVE
+            )
 
-            return generated_text
+            return self._extract_text(response)
 
         except ConnectionError as e:
             raise OllamaConnectionError(
@@ -81,6 +125,55 @@ class OllamaLLMClient:
         except Exception as e:
             raise GenerationError(f"Failed to generate text: {e}")
 
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """chat 메시지 구성
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
+
+        Returns:
+            List[Dict[str, str]]: (시스템 +) 사용자 메시지
+        """
+        messages = []
+
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+
+        return messages
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        """chat 응답에서 생성 텍스트 추출
+
+        Args:
+            response: Ollama chat 응답
+
+        Returns:
+            str: 생성된 텍스트
+
+        Raises:
+            GenerationError: 응답이 없거나 비어 있을 때
+        """
+        if not response or "message" not in response:
+            raise GenerationError("No response from Ollama")
+
+        generated_text = response["message"]["content"]
+
+        if not generated_text:
+            raise GenerationError("Empty response from Ollama")
+
+        return generated_text
+
     def generate_stream(
         self,
         prompt: str,
@@ -101,28 +194,18 @@ class OllamaLLMClient:
         """
         try:
             # 메시지 구성
-            messages = []
-
-            if system_prompt:
-                messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+            messages = self._build_messages(prompt, system_prompt)
 
             # Ollama 스트리밍 호출
-            stream = ollama.chat(
+            stream = self._client.chat(
                 model=self.model,
                 messages=messages,
                 stream=True,
                 options={
                     "temperature": self.temperature,
                     "num_predict": self.max_tokens,
-                }
+                },
+                keep_alive=settings.OLLAMA_KEEP_ALIVE
             )
 
             for chunk in stream:
@@ -136,3 +219,56 @@ class OllamaLLMClient:
             )
         except Exception as e:
             raise GenerationError(f"Failed to generate stream: {e}")
+
+    def generate_stream_into_parser(
+        self,
+        prompt: str,
+        parser: OutputParser,
+        source_endpoint: str,
+        system_prompt: Optional[str] = None,
+        check_every: int = 8
+    ) -> Iterator[GenerationResponse]:
+        """스트리밍 생성과 출력 파싱을 겹쳐서 수행
+
+        cURL 코드 블록이 닫히는 즉시 조기 응답(신뢰도 medium)을 yield 하고,
+        스트림이 끝나면 전체 출력을 파싱한 최종 응답을 yield 합니다.
+
+        Args:
+            prompt: 사용자 프롬프트
+            parser: 출력 파서
+            source_endpoint: 사용된 엔드포인트
+            system_prompt: 시스템 프롬프트
+            check_every: 부분 파싱을 시도할 청크 간격
+
+        Yields:
+            GenerationResponse: 조기 응답 (있을 경우), 그 다음 최종 응답
+
+        Raises:
+            GenerationError: 생성 또는 파싱 실패 시
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        buffer = io.StringIO()
+        early_sent = False
+
+        for i, piece in enumerate(self.generate_stream(prompt, system_prompt), 1):
+            buffer.write(piece)
+
+            if not early_sent and i % check_every == 0:
+                partial = parser.try_parse_partial(buffer.getvalue(), source_endpoint)
+                if partial is not None:
+                    early_sent = True
+                    yield partial
+
+        yield parser.parse_curl_response(buffer.getvalue(), source_endpoint)
+
+
+def get_llm_client() -> OllamaLLMClient:
+    """공유 LLM 클라이언트 반환 (커넥션 풀을 요청 간에 재사용)
+
+    Returns:
+        OllamaLLMClient: 기본 모델을 사용하는 싱글톤 클라이언트
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = OllamaLLMClient()
+    return _default_client
@@ -1,11 +1,46 @@
 """LLM 출력 파서"""
 
 import re
-from typing import Dict, List, Literal
-from src.core.models import CurlCommand, GenerationResponse
+from typing import Dict, List, Literal, Optional
+from src.core.models import GenerationResponse
 from src.core.exceptions import GenerationError
 
 
+# 정규식 패턴 (모듈 로드 시 한 번만 컴파일)
+_INSUFFICIENT_PAT = re.compile(
+    r"cURL 생성 불가|정보 부족|insufficient information|cannot generate",
+    re.IGNORECASE,
+)
+_MISSING_INFO_PAT = re.compile(r"정보 부족:\s*(.+)", re.IGNORECASE)
+_CURL_UNAVAILABLE_PAT = re.compile(r"cURL 생성 불가:\s*(.+)", re.IGNORECASE)
+_STATUS_LINE_PAT = re.compile(r"(\d{3}):\s*(.+)")
+_CURL_BLOCK_PAT = re.compile(r"```(?:bash|sh)?\s*\n(curl\s+.+?)\n```", re.DOTALL | re.IGNORECASE)
+# 코드 블록이 없을 때: curl로 시작하는 라인 + 백슬래시로 이어지는 라인들
+_CURL_FALLBACK_PAT = re.compile(r"^[ \t]*(curl\b(?:[^\n]*\\\n)*[^\n]*)", re.MULTILINE)
+
+_WARNING_PAT = re.compile(r"^.*(?:⚠️|경고).*$", re.MULTILINE)
+
+# 섹션 스캐너: cURL 코드 블록과 섹션 헤더를 한 번의 패스로 찾음
+_SECTION_PAT = re.compile(
+    r"(?P<curl>```(?:bash|sh)?\s*\n(?P<curl_body>curl\s+.+?)\n```)"
+    r"|(?P<explanation>설명:\s*\n)"
+    r"|(?P<required>필수 입력:\s*\n)"
+    r"|(?P<responses>예상 응답:\s*\n)"
+    r"|(?P<confidence>신뢰도:)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# 신뢰도 값 매핑
+_CONFIDENCE_VALUES = {
+    "high": "high",
+    "높음": "high",
+    "medium": "medium",
+    "중간": "medium",
+    "low": "low",
+    "낮음": "low",
+}
+
+
 class OutputParser:
     """LLM 출력 파싱"""
 
@@ -30,54 +65,93 @@ class OutputParser:
             # cURL 생성 불가 체크
             if self._is_insufficient_info(llm_output):
                 missing_info = self._extract_missing_info(llm_output)
-                return GenerationResponse(
-                    curl_command=CurlCommand(
-                        command="",
-                        explanation=llm_output,
-                        required_params=[],
-                        optional_params=[],
-                        expected_responses={}
-                    ),
-                    source_endpoint=source_endpoint,
-                    confidence="low",
-                    warnings=[f"정보 부족: {missing_info}"]
-                )
+                return GenerationResponse.from_trusted({
+                    "curl_command": {
+                        "command": "",
+                        "explanation": llm_output,
+                        "required_params": [],
+                        "optional_params": [],
+                        "expected_responses": {},
+                    },
+                    "source_endpoint": source_endpoint,
+                    "confidence": "low",
+                    "warnings": [f"정보 부족: {missing_info}"],
+                })
+
+            # 섹션 스캔 (한 번의 패스)
+            sections = self._scan_sections(llm_output)
 
             # cURL 명령어 추출
-            curl_command = self._extract_curl_command(llm_output)
+            curl_command = self._extract_curl_command(llm_output, sections.get("curl"))
 
             # 설명 추출
-            explanation = self._extract_explanation(llm_output)
+            explanation = self._extract_explanation(sections.get("explanation"))
 
             # 필수/선택 파라미터 추출
-            required_params = self._extract_required_params(llm_output)
+            required_params = self._extract_required_params(sections.get("required"))
             optional_params = self._extract_optional_params(llm_output)
 
             # 예상 응답 추출
-            expected_responses = self._extract_expected_responses(llm_output)
+            expected_responses = self._extract_expected_responses(sections.get("responses"))
 
             # 신뢰도 추출
-            confidence = self._extract_confidence(llm_output)
+            confidence = self._extract_confidence(sections.get("confidence"))
 
             # 경고 추출
             warnings = self._extract_warnings(llm_output)
 
-            return GenerationResponse(
-                curl_command=CurlCommand(
-                    command=curl_command,
-                    explanation=explanation,
-                    required_params=required_params,
-                    optional_params=optional_params,
-                    expected_responses=expected_responses
-                ),
-                source_endpoint=source_endpoint,
-                confidence=confidence,
-                warnings=warnings
-            )
+            return GenerationResponse.from_trusted({
+                "curl_command": {
+                    "command": curl_command,
+                    "explanation": explanation,
+                    "required_params": required_params,
+                    "optional_params": optional_params,
+                    "expected_responses": expected_responses,
+                },
+                "source_endpoint": source_endpoint,
+                "confidence": confidence,
+                "warnings": warnings,
+            })
 
         except Exception as e:
             raise GenerationError(f"Failed to parse LLM output: {e}")
 
+    def try_parse_partial(
+        self,
+        buffer: str,
+        source_endpoint: str
+    ) -> Optional[GenerationResponse]:
+        """스트리밍 중인 부분 출력에서 조기 응답 생성
+
+        cURL 코드 블록이 닫혔으면 나머지 섹션을 기다리지 않고 명령어만 담은 응답을 반환합니다.
+
+        Args:
+            buffer: 지금까지 수신한 LLM 출력
+            source_endpoint: 사용된 엔드포인트
+
+        Returns:
+            Optional[GenerationResponse]: 조기 응답 (신뢰도 medium), 코드 블록이 아직 없으면 None
+        """
+        if _INSUFFICIENT_PAT.search(buffer):
+            return None
+
+        match = _CURL_BLOCK_PAT.search(buffer)
+        if not match:
+            return None
+
+        return GenerationResponse.from_trusted({
+            "curl_command": {
+                "command": match.group(1).strip(),
+                "explanation": "",
+                "required_params": [],
+                "optional_params": [],
+                "expected_responses": {},
+            },
+            "source_endpoint": source_endpoint,
+            "confidence": "medium",
+            "warnings": [],
+        })
+
     def _is_insufficient_info(self, text: str) -> bool:
         """정보 부족 여부 확인
 
@@ -87,14 +161,7 @@ class OutputParser:
         Returns:
             bool: 정보가 부족하면 True
         """
-        patterns = [
-            r"cURL 생성 불가",
-            r"정보 부족",
-            r"insufficient information",
-            r"cannot generate",
-        ]
-
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+        return _INSUFFICIENT_PAT.search(text) is not None
 
     def _extract_missing_info(self, text: str) -> str:
         """부족한 정보 추출
@@ -105,21 +172,51 @@ class OutputParser:
         Returns:
             str: 부족한 정보
         """
-        match = re.search(r"정보 부족:\s*(.+)", text, re.IGNORECASE)
+        match = _MISSING_INFO_PAT.search(text)
         if match:
             return match.group(1).strip()
 
-        match = re.search(r"cURL 생성 불가:\s*(.+)", text, re.IGNORECASE)
+        match = _CURL_UNAVAILABLE_PAT.search(text)
         if match:
             return match.group(1).strip()
 
         return "알 수 없음"
 
-    def _extract_curl_command(self, text: str) -> str:
+    def _scan_sections(self, text: str) -> Dict[str, str]:
+        """LLM 출력을 한 번 훑어 섹션별 본문 추출
+
+        각 섹션 본문은 다음 섹션 헤더 또는 빈 줄 전까지입니다.
+        같은 섹션이 여러 번 나오면 첫 번째만 사용합니다.
+
+        Args:
+            text: LLM 출력
+
+        Returns:
+            Dict[str, str]: 섹션 이름 -> 본문 (curl은 코드 블록 안의 명령어)
+        """
+        sections: Dict[str, str] = {}
+        matches = list(_SECTION_PAT.finditer(text))
+
+        for i, match in enumerate(matches):
+            name = match.lastgroup
+            if name in sections:
+                continue
+
+            if name == "curl":
+                sections[name] = match.group("curl_body")
+                continue
+
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            sections[name] = text[match.end():end].split("\n\n", 1)[0]
+
+        return sections
+
+    def _extract_curl_command(self, text: str, block: Optional[str] = None) -> str:
         """cURL 명령어 추출
 
         Args:
             text: LLM 출력
+            block: 코드 블록에서 찾은 cURL 명령어 (없으면 라인 단위로 탐색)
 
         Returns:
             str: cURL 명령어
@@ -128,65 +225,40 @@ class OutputParser:
             GenerationError: cURL 명령어를 찾을 수 없을 때
         """
         # 코드 블록에서 추출
-        match = re.search(r"```(?:bash|sh)?\s*\n(curl\s+.+?)\n```", text, re.DOTALL | re.IGNORECASE)
+        if block:
+            return block.strip()
+
+        # curl로 시작하는 라인 찾기 (줄 끝 백슬래시는 다음 라인으로 이어짐)
+        match = _CURL_FALLBACK_PAT.search(text)
         if match:
             return match.group(1).strip()
 
-        # 단순 curl로 시작하는 라인 찾기
-        lines = text.split("\n")
-        curl_lines = []
-        in_curl = False
-
-        for line in lines:
-            if line.strip().startswith("curl"):
-                in_curl = True
-                curl_lines.append(line)
-            elif in_curl:
-                if line.strip().endswith("\\"):
-                    curl_lines.append(line)
-                elif line.strip() and not line.strip().startswith(("-", "}")):
-                    curl_lines.append(line)
-                    break
-                elif not line.strip():
-                    break
-
-        if curl_lines:
-            return "\n".join(curl_lines).strip()
-
         raise GenerationError("Could not extract cURL command from output")
 
-    def _extract_explanation(self, text: str) -> str:
+    def _extract_explanation(self, section: Optional[str]) -> str:
         """설명 추출
 
         Args:
-            text: LLM 출력
+            section: "설명:" 섹션 본문
 
         Returns:
             str: 설명
         """
-        # "설명:" 이후 텍스트
-        match = re.search(r"설명:\s*\n(.+?)(?:\n\n|필수 입력|예상 응답|$)", text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
+        return section.strip() if section else ""
 
-        return ""
-
-    def _extract_required_params(self, text: str) -> List[str]:
+    def _extract_required_params(self, section: Optional[str]) -> List[str]:
         """필수 파라미터 추출
 
         Args:
-            text: LLM 출력
+            section: "필수 입력:" 섹션 본문
 
         Returns:
             List[str]: 필수 파라미터 목록
         """
         params = []
 
-        # "필수 입력:" 섹션 찾기
-        match = re.search(r"필수 입력:\s*\n(.+?)(?:\n\n|예상 응답|신뢰도|$)", text, re.DOTALL)
-        if match:
-            lines = match.group(1).strip().split("\n")
-            for line in lines:
+        if section:
+            for line in section.strip().split("\n"):
                 line = line.strip()
                 if line.startswith("-"):
                     param = line[1:].strip()
@@ -206,28 +278,25 @@ class OutputParser:
         # 현재는 빈 리스트 반환 (필요시 구현)
         return []
 
-    def _extract_expected_responses(self, text: str) -> Dict[str, str]:
+    def _extract_expected_responses(self, section: Optional[str]) -> Dict[str, str]:
         """예상 응답 추출
 
         Args:
-            text: LLM 출력
+            section: "예상 응답:" 섹션 본문
 
         Returns:
             Dict[str, str]: 상태 코드 -> 설명 매핑
         """
         responses = {}
 
-        # "예상 응답:" 섹션 찾기
-        match = re.search(r"예상 응답:\s*\n(.+?)(?:\n\n|신뢰도|$)", text, re.DOTALL)
-        if match:
-            lines = match.group(1).strip().split("\n")
-            for line in lines:
+        if section:
+            for line in section.strip().split("\n"):
                 line = line.strip()
                 if line.startswith("-"):
                     line = line[1:].strip()
 
                 # "200: 성공" 형식
-                status_match = re.match(r"(\d{3}):\s*(.+)", line)
+                status_match = _STATUS_LINE_PAT.match(line)
                 if status_match:
                     code = status_match.group(1)
                     desc = status_match.group(2).strip()
@@ -235,23 +304,20 @@ class OutputParser:
 
         return responses
 
-    def _extract_confidence(self, text: str) -> Literal["high", "medium", "low"]:
+    def _extract_confidence(self, section: Optional[str]) -> Literal["high", "medium", "low"]:
         """신뢰도 추출
 
         Args:
-            text: LLM 출력
+            section: "신뢰도:" 이후 본문
 
         Returns:
             Literal["high", "medium", "low"]: 신뢰도
         """
-        text_lower = text.lower()
-
-        if "신뢰도: high" in text_lower or "신뢰도: 높음" in text_lower:
-            return "high"
-        elif "신뢰도: medium" in text_lower or "신뢰도: 중간" in text_lower:
-            return "medium"
-        elif "신뢰도: low" in text_lower or "신뢰도: 낮음" in text_lower:
-            return "low"
+        if section:
+            value = section.strip().lower()
+            for keyword, level in _CONFIDENCE_VALUES.items():
+                if value.startswith(keyword):
+                    return level
 
         # 기본값: medium
         return "medium"
@@ -265,12 +331,5 @@ class OutputParser:
         Returns:
             List[str]: 경고 목록
         """
-        warnings = []
-
         # "⚠️" 또는 "경고" 포함 라인 찾기
-        lines = text.split("\n")
-        for line in lines:
-            if "⚠️" in line or "경고" in line.lower():
-                warnings.append(line.strip())
-
-        return warnings
+        return [line.strip() for line in _WARNING_PAT.findall(text)]
@@ -1,45 +1,15 @@
 """프롬프트 생성기"""
 
-from typing import List
+from collections import OrderedDict
+from typing import ClassVar, List, Tuple
 from src.core.models import EndpointChunk, GenerationRequest
 
+# 포맷된 명세서 캐시 최대 항목 수
+_FORMAT_CACHE_SIZE = 128
 
-class PromptBuilder:
-    """LLM 프롬프트 구성"""
-
-    def __init__(self):
-        """Prompt Builder 초기화"""
-        self.system_prompt = self._build_system_prompt()
 
-    def build_prompt(
-        self,
-        query: str,
-        chunks: List[EndpointChunk]
-    ) -> GenerationRequest:
-        """프롬프트 생성
-
-        Args:
-            query: 사용자 질의
-            chunks: 검색된 엔드포인트 청크 리스트
-
-        Returns:
-            GenerationRequest: 생성 요청
-        """
-        user_prompt = self._build_user_prompt(query, chunks)
-
-        return GenerationRequest(
-            query=query,
-            retrieved_chunks=chunks,
-            system_prompt=self.system_prompt
-        )
-
-    def _build_system_prompt(self) -> str:
-        """시스템 프롬프트 생성
-
-        Returns:
-            str: 시스템 프롬프트
-        """
-        return """당신은 OpenAPI 명세서에서 정확한 cURL 명령어를 생성하는 전문가입니다.
+# 시스템 프롬프트 (요청마다 동일하므로 모듈 상수로 유지)
+_SYSTEM_PROMPT = """당신은 OpenAPI 명세서에서 정확한 cURL 명령어를 생성하는 전문가입니다.
 
 필수 규칙:
 1. 제공된 명세서에만 기반하여 cURL 생성
@@ -62,6 +32,41 @@ curl -X [METHOD] [URL] \\
 - 신뢰도: high/medium/low
 """
 
+
+class PromptBuilder:
+    """LLM 프롬프트 구성"""
+
+    system_prompt = _SYSTEM_PROMPT
+
+    # chunk_id 튜플 -> 포맷된 명세서 텍스트 (LRU, 인스턴스 간 공유)
+    _format_cache: ClassVar["OrderedDict[Tuple[str, ...], str]"] = OrderedDict()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """포맷 캐시 비우기 (인덱스가 바뀌면 호출)"""
+        cls._format_cache.clear()
+
+    def build_prompt(
+        self,
+        query: str,
+        chunks: List[EndpointChunk]
+    ) -> GenerationRequest:
+        """프롬프트 생성
+
+        Args:
+            query: 사용자 질의
+            chunks: 검색된 엔드포인트 청크 리스트
+
+        Returns:
+            GenerationRequest: 생성 요청
+        """
+        # 검색 단계에서 만든 청크이므로 재검증 생략
+        return GenerationRequest.model_construct(
+            query=query,
+            retrieved_chunks=chunks,
+            system_prompt=self.system_prompt
+        )
+
     def _build_user_prompt(
         self,
         query: str,
@@ -92,7 +97,32 @@ curl -X [METHOD] [URL] \\
         return prompt
 
     def _format_chunks(self, chunks: List[EndpointChunk]) -> str:
-        """청크를 명세서 텍스트로 포맷
+        """청크를 명세서 텍스트로 포맷 (chunk_id 조합별 캐시)
+
+        Args:
+            chunks: 엔드포인트 청크 리스트
+
+        Returns:
+            str: 포맷된 명세서 텍스트
+        """
+        key = tuple(chunk.chunk_id for chunk in chunks)
+        cache = self._format_cache
+
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+        formatted = self._render_chunks(chunks)
+
+        cache[key] = formatted
+        if len(cache) > _FORMAT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return formatted
+
+    def _render_chunks(self, chunks: List[EndpointChunk]) -> str:
+        """청크를 명세서 텍스트로 렌더링 (캐시 미스 시)
 
         Args:
             chunks: 엔드포인트 청크 리스트
@@ -103,38 +133,42 @@ curl -X [METHOD] [URL] \\
         formatted_chunks = []
 
         for i, chunk in enumerate(chunks, 1):
-            chunk_text = f"""[엔드포인트 {i}]
-메서드: {chunk.method}
-경로: {chunk.path}
-요약: {chunk.summary or "N/A"}
-설명: {chunk.description or "N/A"}"""
+            parts = [
+                f"[엔드포인트 {i}]",
+                f"메서드: {chunk.method}",
+                f"경로: {chunk.path}",
+                f"요약: {chunk.summary or 'N/A'}",
+                f"설명: {chunk.description or 'N/A'}",
+            ]
 
             # 파라미터
             if chunk.parameters:
-                chunk_text += "\n\n파라미터:"
+                parts.append("\n파라미터:")
                 for param in chunk.parameters:
                     required = "필수" if param.required else "선택"
-                    chunk_text += f"\n  - {param.name} ({param.in_}): {param.description or 'N/A'} [{required}]"
+                    parts.append(
+                        f"  - {param.name} ({param.in_}): {param.description or 'N/A'} [{required}]"
+                    )
 
             # 요청 바디
             if chunk.request_body:
-                chunk_text += "\n\n요청 바디:"
-                chunk_text += f"\n  필수: {chunk.request_body.required}"
+                parts.append("\n요청 바디:")
+                parts.append(f"  필수: {chunk.request_body.required}")
                 if chunk.request_body.content:
-                    for content_type, schema in chunk.request_body.content.items():
-                        chunk_text += f"\n  Content-Type: {content_type}"
+                    for content_type in chunk.request_body.content:
+                        parts.append(f"  Content-Type: {content_type}")
 
             # 응답
             if chunk.responses:
-                chunk_text += "\n\n응답:"
+                parts.append("\n응답:")
                 for status_code, response in chunk.responses.items():
-                    chunk_text += f"\n  {status_code}: {response.description}"
+                    parts.append(f"  {status_code}: {response.description}")
 
             # 인증
             if chunk.metadata.requires_auth:
-                chunk_text += "\n\n인증: 필요 (Bearer Token)"
+                parts.append("\n인증: 필요 (Bearer Token)")
 
-            formatted_chunks.append(chunk_text)
+            formatted_chunks.append("\n".join(parts))
 
         return "\n\n" + "=" * 60 + "\n\n".join(formatted_chunks)
 
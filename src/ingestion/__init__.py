@@ -2,12 +2,28 @@
 
 from .parser import OpenAPIParser
 from .chunker import EndpointChunker
-from .embedder import OllamaEmbedder
-from .indexer import ChromaIndexer
+
+# embedder/indexer는 ollama/chromadb를 import 하므로 처음 접근할 때 로드 (PEP 562)
+_LAZY_ATTRS = {
+    "OllamaEmbedder": "embedder",
+    "get_embedder": "embedder",
+    "ChromaIndexer": "indexer",
+    "get_indexer": "indexer",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "OpenAPIParser",
     "EndpointChunker",
     "OllamaEmbedder",
+    "get_embedder",
     "ChromaIndexer",
+    "get_indexer",
 ]
@@ -1,9 +1,13 @@
 """엔드포인트 청킹"""
 
-from typing import List
-from src.core.models import OpenAPISpec, EndpointChunk, ChunkMetadata, Operation
+from typing import Iterator, List
+from src.core.models import OpenAPISpec, EndpointChunk, Operation
 from src.core.exceptions import ChunkingError
 
+# PathItem의 HTTP 메서드 필드 (청크 순서 = 튜플 순서)
+_HTTP_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
+_HTTP_METHODS_UPPER = tuple(method.upper() for method in _HTTP_METHODS)
+
 
 class EndpointChunker:
     """엔드포인트 중심 청킹"""
@@ -20,34 +24,38 @@ class EndpointChunker:
         Raises:
             ChunkingError: 청킹 실패 시
         """
-        chunks = []
+        chunks = list(self.iter_chunks(spec))
+
+        if not chunks:
+            raise ChunkingError("Failed to chunk spec: No chunks created from spec")
+
+        return chunks
+
+    def iter_chunks(self, spec: OpenAPISpec) -> Iterator[EndpointChunk]:
+        """OpenAPI 명세서의 엔드포인트 청크를 하나씩 생성
+
+        전체 청크 리스트를 만들지 않으므로 임베딩 배치와 함께 스트리밍할 수 있습니다.
+
+        Args:
+            spec: OpenAPI 명세서
+
+        Yields:
+            EndpointChunk: 엔드포인트 청크
 
+        Raises:
+            ChunkingError: 청킹 실패 시
+        """
         try:
             for path, path_item in spec.paths.items():
                 # 각 HTTP 메서드별로 청크 생성
-                methods = {
-                    "get": path_item.get,
-                    "post": path_item.post,
-                    "put": path_item.put,
-                    "delete": path_item.delete,
-                    "patch": path_item.patch,
-                    "options": path_item.options,
-                    "head": path_item.head,
-                }
-
-                for method, operation in methods.items():
+                for method, method_upper in zip(_HTTP_METHODS, _HTTP_METHODS_UPPER):
+                    operation = getattr(path_item, method)
                     if operation is not None:
-                        chunk = self._create_chunk(
+                        yield self._create_chunk(
                             path=path,
-                            method=method.upper(),
+                            method=method_upper,
                             operation=operation
                         )
-                        chunks.append(chunk)
-
-            if not chunks:
-                raise ChunkingError("No chunks created from spec")
-
-            return chunks
 
         except Exception as e:
             raise ChunkingError(f"Failed to chunk spec: {e}")
@@ -71,32 +79,30 @@ class EndpointChunker:
         # 청크 ID 생성
         chunk_id = f"{method}_{path}"
 
-        # 메타데이터 생성
-        metadata = ChunkMetadata(
-            endpoint=path,
-            method=method,
-            tags=operation.tags or [],
-            operation_id=operation.operationId,
-            requires_auth=self._requires_auth(operation),
-            content_type=self._get_content_type(operation)
-        )
-
-        # 청크 생성
-        chunk = EndpointChunk(
-            chunk_id=chunk_id,
-            method=method,
-            path=path,
-            summary=operation.summary,
-            description=operation.description,
-            parameters=operation.parameters or [],
-            request_body=operation.requestBody,
-            responses=operation.responses,
-            metadata=metadata
-        )
+        # 청크 생성 (Operation은 파싱 시 이미 검증되었으므로 재검증 생략)
+        chunk = EndpointChunk.from_trusted({
+            "chunk_id": chunk_id,
+            "method": method,
+            "path": path,
+            "summary": operation.summary,
+            "description": operation.description,
+            "parameters": operation.parameters or [],
+            "request_body": operation.requestBody,
+            "responses": operation.responses,
+            "metadata": {
+                "endpoint": path,
+                "method": method,
+                "tags": operation.tags or [],
+                "operation_id": operation.operationId,
+                "requires_auth": self._requires_auth(operation),
+                "content_type": self._get_content_type(operation),
+            },
+        })
 
         return chunk
 
-    def _requires_auth(self, operation: Operation) -> bool:
+    @staticmethod
+    def _requires_auth(operation: Operation) -> bool:
         """인증 필요 여부 확인
 
         Args:
@@ -105,11 +111,10 @@ class EndpointChunker:
         Returns:
             bool: 인증이 필요하면 True
         """
-        if operation.security:
-            return len(operation.security) > 0
-        return False
+        return bool(operation.security)
 
-    def _get_content_type(self, operation: Operation) -> str:
+    @staticmethod
+    def _get_content_type(operation: Operation) -> str:
         """Content-Type 추출
 
         Args:
@@ -118,9 +123,8 @@ class EndpointChunker:
         Returns:
             str: Content-Type (기본값: application/json)
         """
-        if operation.requestBody and operation.requestBody.content:
-            content_types = list(operation.requestBody.content.keys())
-            if content_types:
-                return content_types[0]
+        request_body = operation.requestBody
+        if request_body and request_body.content:
+            return next(iter(request_body.content))
 
         return "application/json"
@@ -1,12 +1,34 @@
 """Ollama 임베딩 생성기"""
 
-from typing import List
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterable, List, Optional
+import httpx
 import ollama
+import orjson
 
 from src.core.models import EndpointChunk
+from src.core.async_client import LoopLocalAsyncClient
 from src.core.config import settings
 from src.core.exceptions import EmbeddingError, OllamaConnectionError
 
+# 모델별 공유 임베더 (get_embedder)
+_shared_embedders: Dict[str, "OllamaEmbedder"] = {}
+_shared_lock = threading.Lock()
+
+
+def _is_transient(error: Exception) -> bool:
+    """서브 배치를 줄여 재시도할 만한 일시적 오류인지 확인 (타임아웃, 5xx)
+
+    모델 없음, 잘못된 요청(4xx)이나 임베딩 개수 불일치는 배치를 줄여도 같으므로 제외합니다.
+    """
+    if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+        return True
+    return isinstance(error, ollama.ResponseError) and error.status_code >= 500
+
 
 class OllamaEmbedder:
     """Ollama를 사용한 임베딩 생성"""
@@ -18,6 +40,20 @@ class OllamaEmbedder:
         """
         self.model = model or settings.OLLAMA_EMBEDDING_MODEL
 
+        # 임베딩 차원 (설정값 또는 첫 임베딩 결과로 채움)
+        self._dim: Optional[int] = (
+            settings.OLLAMA_EMBEDDING_DIM
+            if self.model == settings.OLLAMA_EMBEDDING_MODEL
+            else None
+        )
+
+        # 스레드 간 공유하는 클라이언트 (keep-alive 커넥션 재사용)
+        self._client = ollama.Client(
+            host=settings.OLLAMA_BASE_URL,
+            timeout=settings.OLLAMA_TIMEOUT
+        )
+        self._async_client = LoopLocalAsyncClient(settings.OLLAMA_BASE_URL, settings.OLLAMA_TIMEOUT)
+
     def embed_chunk(self, chunk: EndpointChunk) -> List[float]:
         """단일 청크 임베딩 생성
 
@@ -33,20 +69,45 @@ class OllamaEmbedder:
         text = chunk.to_embedding_text()
         return self.embed_text(text)
 
-    def embed_chunks(self, chunks: List[EndpointChunk]) -> List[List[float]]:
+    def embed_chunks(self, chunks: Iterable[EndpointChunk]) -> List[List[float]]:
         """여러 청크 배치 임베딩 생성
 
+        청크를 OLLAMA_EMBED_BATCH_SIZE개씩 읽어 OLLAMA_CONCURRENCY개 스레드로 동시에
+        요청합니다. 제너레이터(EndpointChunker.iter_chunks)를 넘기면 요청 중인 배치의
+        텍스트만 메모리에 유지됩니다.
+
         Args:
-            chunks: 엔드포인트 청크 리스트
+            chunks: 엔드포인트 청크 (리스트 또는 이터러블)
 
         Returns:
-            List[List[float]]: 임베딩 벡터 리스트
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서 유지)
 
         Raises:
             EmbeddingError: 임베딩 생성 실패 시
         """
-        texts = [chunk.to_embedding_text() for chunk in chunks]
-        return self.embed_batch(texts)
+        texts = (chunk.to_embedding_text() for chunk in chunks)
+        batch_size = settings.OLLAMA_EMBED_BATCH_SIZE
+        batches = iter(lambda: list(islice(texts, batch_size)), [])
+
+        embeddings: List[List[float]] = []
+        concurrency = settings.OLLAMA_CONCURRENCY
+        if concurrency <= 1:
+            for batch in batches:
+                embeddings.extend(self.embed_batch(batch))
+            return embeddings
+
+        # 동시에 요청 중인 배치를 concurrency개로 제한 (순서대로 결과 수집)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight: Deque[Future] = deque()
+            for batch in batches:
+                in_flight.append(executor.submit(self.embed_batch, batch))
+                if len(in_flight) >= concurrency:
+                    embeddings.extend(in_flight.popleft().result())
+
+            while in_flight:
+                embeddings.extend(in_flight.popleft().result())
+
+        return embeddings
 
     def embed_text(self, text: str) -> List[float]:
         """단일 텍스트 임베딩 생성
@@ -61,25 +122,23 @@ class OllamaEmbedder:
             EmbeddingError: 임베딩 생성 실패 시
             OllamaConnectionError: Ollama 연결 실패 시
         """
-        try:
-            response = ollama.embed(
-                model=self.model,
-                input=text
-            )
+        # /api/embed 배치 경로를 공유 (구버전 Ollama면 /api/embeddings로 대체)
+        return self.embed_batch([text])[0]
 
-            embeddings = response.get("embeddings")
-            if not embeddings or len(embeddings) == 0:
-                raise EmbeddingError("No embeddings returned from Ollama")
+    async def aembed_text(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 생성 (비동기)
 
-            return embeddings[0]
+        Args:
+            text: 임베딩할 텍스트
 
-        except ConnectionError as e:
-            raise OllamaConnectionError(
-                f"Failed to connect to Ollama: {e}. "
-                "Make sure Ollama is running (ollama serve)"
-            )
-        except Exception as e:
-            raise EmbeddingError(f"Failed to generate embedding: {e}")
+        Returns:
+            List[float]: 임베딩 벡터
+
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 시
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        return (await self.embed_batch_async([text]))[0]
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """여러 텍스트 배치 임베딩 생성
@@ -98,20 +157,224 @@ class OllamaEmbedder:
             return []
 
         try:
-            response = ollama.embed(
-                model=self.model,
-                input=texts
+            embeddings = self._embed_with_backoff(texts, settings.OLLAMA_EMBED_BATCH_SIZE)
+            self._dim = len(embeddings[0])
+            return embeddings
+
+        except ConnectionError as e:
+            raise OllamaConnectionError(
+                f"Failed to connect to Ollama: {e}. "
+                "Make sure Ollama is running (ollama serve)"
+            )
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate embeddings: {e}")
+
+    def _embed_with_backoff(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """서브 배치로 나눠 임베딩하고, 실패한 서브 배치는 크기를 절반으로 줄여 재시도
+
+        타임아웃과 5xx(서버 OOM 등)만 재시도하고, 크기 1에서도 실패하면 예외를 그대로
+        전달합니다. 그 밖의 오류(연결 실패, 4xx 등)는 바로 전달합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            batch_size: 서브 배치 최대 텍스트 수
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트
+        """
+        embeddings: List[List[float]] = []
+
+        for group in self._group_texts(texts, batch_size):
+            try:
+                embeddings.extend(self._embed_sub_batch(group))
+            except Exception as e:
+                # 타임아웃, 5xx(OOM 등)만 더 작은 배치로 재시도
+                if len(group) == 1 or not _is_transient(e):
+                    raise
+                embeddings.extend(self._embed_with_backoff(group, len(group) // 2))
+
+        return embeddings
+
+    def _group_texts(self, texts: List[str], batch_size: int) -> List[List[str]]:
+        """텍스트 수(batch_size)와 총 문자 수(OLLAMA_EMBED_MAX_CHARS) 한도로 서브 배치 분할
+
+        한도보다 긴 텍스트는 단독 서브 배치가 됩니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            batch_size: 서브 배치 최대 텍스트 수
+
+        Returns:
+            List[List[str]]: 서브 배치 리스트
+        """
+        batch_size = max(1, batch_size)
+        max_chars = settings.OLLAMA_EMBED_MAX_CHARS
+
+        groups: List[List[str]] = []
+        group: List[str] = []
+        chars = 0
+
+        for text in texts:
+            if group and (len(group) >= batch_size or chars + len(text) > max_chars):
+                groups.append(group)
+                group = []
+                chars = 0
+            group.append(text)
+            chars += len(text)
+
+        if group:
+            groups.append(group)
+
+        return groups
+
+    def _embed_sub_batch(self, texts: List[str]) -> List[List[float]]:
+        """한 번의 /api/embed 요청으로 서브 배치 임베딩 생성
+
+        /api/embed가 없거나(404) 응답에 "embeddings"가 없으면 (구버전 Ollama)
+        /api/embeddings로 한 건씩 요청합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트 (최대 OLLAMA_EMBED_BATCH_SIZE개)
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트
+
+        Raises:
+            EmbeddingError: 임베딩 개수가 입력과 다를 때
+        """
+        embeddings = self._request_embed(texts)
+        if not embeddings:
+            # 순차 폴백
+            embeddings = [
+                self._client.embeddings(
+                    model=self.model, prompt=text, keep_alive=settings.OLLAMA_KEEP_ALIVE
+                )["embedding"]
+                for text in texts
+            ]
+
+        if len(embeddings) != len(texts):
+            raise EmbeddingError(
+                f"Expected {len(texts)} embeddings, got {len(embeddings)}"
             )
 
-            embeddings = response.get("embeddings")
-            if not embeddings:
-                raise EmbeddingError("No embeddings returned from Ollama")
+        return embeddings
+
+    def _request_embed(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """/api/embed 요청 후 응답의 embeddings 반환
+
+        SDK 응답 모델은 stdlib json 파싱 후 실수 하나하나를 pydantic으로 검증하므로,
+        원시 응답을 받을 수 있으면 orjson으로 바로 파싱합니다.
 
-            if len(embeddings) != len(texts):
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            Optional[List[List[float]]]: 임베딩 벡터 리스트
+                (/api/embed가 없는 구버전 Ollama(404)이거나 응답에 없으면 None)
+        """
+        payload = {"model": self.model, "input": texts, "keep_alive": settings.OLLAMA_KEEP_ALIVE}
+
+        try:
+            request_raw = getattr(self._client, "_request_raw", None)
+            if request_raw is None:
+                return self._client.embed(**payload).get("embeddings")
+
+            response = request_raw("POST", "/api/embed", json=payload)
+        except ollama.ResponseError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return orjson.loads(response.content).get("embeddings")
+
+    async def _arequest_embed(
+        self,
+        client: "ollama.AsyncClient",
+        texts: List[str]
+    ) -> Optional[List[List[float]]]:
+        """/api/embed 비동기 요청 후 응답의 embeddings 반환 (_request_embed 참고)
+
+        Args:
+            client: 현재 이벤트 루프의 비동기 클라이언트
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            Optional[List[List[float]]]: 임베딩 벡터 리스트
+                (/api/embed가 없는 구버전 Ollama(404)이거나 응답에 없으면 None)
+        """
+        payload = {"model": self.model, "input": texts, "keep_alive": settings.OLLAMA_KEEP_ALIVE}
+
+        try:
+            request_raw = getattr(client, "_request_raw", None)
+            if request_raw is None:
+                return (await client.embed(**payload)).get("embeddings")
+
+            response = await request_raw("POST", "/api/embed", json=payload)
+        except ollama.ResponseError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return orjson.loads(response.content).get("embeddings")
+
+    def embed_batch_concurrent(self, texts: List[str], concurrency: int = 4) -> List[List[float]]:
+        """여러 서브 배치를 동시에 요청하는 배치 임베딩 (embed_batch_async의 동기 래퍼)
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            concurrency: 동시 요청 수
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서 유지)
+
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 시
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        return asyncio.run(self.embed_batch_async(texts, concurrency))
+
+    async def embed_batch_async(self, texts: List[str], concurrency: int = 4) -> List[List[float]]:
+        """서브 배치를 이벤트 루프의 공유 비동기 클라이언트(keep-alive 커넥션 공유)로 동시에 요청
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            concurrency: 동시 요청 수
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서 유지)
+
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 시
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        if not texts:
+            return []
+
+        sub_batches = self._group_texts(texts, settings.OLLAMA_EMBED_BATCH_SIZE)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        client = self._async_client.get()
+
+        async def embed_sub_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                embeddings = await self._arequest_embed(client, batch)
+                if not embeddings:
+                    # 순차 폴백
+                    embeddings = [
+                        (await client.embeddings(
+                            model=self.model, prompt=text, keep_alive=settings.OLLAMA_KEEP_ALIVE
+                        ))["embedding"]
+                        for text in batch
+                    ]
+
+            if len(embeddings) != len(batch):
                 raise EmbeddingError(
-                    f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                    f"Expected {len(batch)} embeddings, got {len(embeddings)}"
                 )
+            return embeddings
 
+        try:
+            results = await asyncio.gather(*(embed_sub_batch(b) for b in sub_batches))
+
+            embeddings = [embedding for batch in results for embedding in batch]
+            self._dim = len(embeddings[0])
             return embeddings
 
         except ConnectionError as e:
@@ -123,7 +386,7 @@ class OllamaEmbedder:
             raise EmbeddingError(f"Failed to generate embeddings: {e}")
 
     def get_embedding_dimension(self) -> int:
-        """임베딩 차원 확인
+        """임베딩 차원 확인 (설정값이나 이전 임베딩 결과가 있으면 요청 없이 반환)
 
         Returns:
             int: 임베딩 벡터 차원
@@ -131,9 +394,29 @@ class OllamaEmbedder:
         Raises:
             EmbeddingError: 차원 확인 실패 시
         """
+        if self._dim is not None:
+            return self._dim
+
         try:
             # 테스트 텍스트로 임베딩 생성
             test_embedding = self.embed_text("test")
             return len(test_embedding)
         except Exception as e:
             raise EmbeddingError(f"Failed to get embedding dimension: {e}")
+
+
+def get_embedder(model: str = None) -> OllamaEmbedder:
+    """공유 임베더 반환 (클라이언트 커넥션과 임베딩 차원 캐시를 요청 간에 재사용)
+
+    Args:
+        model: 임베딩 모델 이름 (기본값: settings.OLLAMA_EMBEDDING_MODEL)
+
+    Returns:
+        OllamaEmbedder: 모델별 싱글톤 임베더
+    """
+    model = model or settings.OLLAMA_EMBEDDING_MODEL
+    with _shared_lock:
+        embedder = _shared_embedders.get(model)
+        if embedder is None:
+            embedder = _shared_embedders[model] = OllamaEmbedder(model)
+    return embedder
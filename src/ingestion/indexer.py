@@ -1,7 +1,10 @@
 """ChromaDB 인덱서"""
 
-from typing import List, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence, Union
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from src.core.models import EndpointChunk
@@ -9,6 +12,47 @@ from src.core.config import settings
 from src.core.exceptions import VectorStoreError
 
 
+# 컬렉션 저장 형식 버전 (2: float32 임베딩 + hnsw:space 지정 + chunk_json 메타데이터)
+INDEX_FORMAT_VERSION = 2
+
+# 대량 적재용 SQLite PRAGMA 이름 → 값 (크래시 시 DB 손상 가능, 처음부터 다시 만드는 인제스트 전용)
+# bulk_mode 종료 시 진입 전 값으로 복원
+# locking_mode=exclusive는 Chroma가 스레드별 커넥션을 쓰므로 다른 커넥션을 막아 제외
+_BULK_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+}
+
+# 대량 적재용 HNSW 파라미터 (bulk_mode 구간에서만 적용, 종료 시 원래 값으로 복원)
+# 삽입을 brute-force 버퍼에 모았다가 batch_size마다 한 번에 HNSW에 반영
+_BULK_HNSW_CONFIG = {
+    "batch_size": 10_000,
+    "sync_threshold": 50_000,
+}
+# Chroma 기본 HNSW 파라미터 (컬렉션 설정에 값이 없을 때 복원용)
+_DEFAULT_HNSW_CONFIG = {
+    "batch_size": 100,
+    "sync_threshold": 1_000,
+}
+
+# 컬렉션별 공유 인덱서 (get_indexer)
+_shared_indexers: Dict[str, "ChromaIndexer"] = {}
+_shared_lock = threading.Lock()
+
+
+def tag_metadata_key(tag: str) -> str:
+    """태그별 불리언 메타데이터 키 (Chroma where 필터로 태그 포함 여부 검색용)"""
+    return f"tag_{tag}"
+
+
+def _as_list(embedding: Union[np.ndarray, List[float]]) -> List[float]:
+    """임베딩 배열을 Chroma API 경계에서 list로 변환"""
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    return embedding
+
+
 class ChromaIndexer:
     """ChromaDB 벡터 저장소 인덱서"""
 
@@ -19,6 +63,13 @@ class ChromaIndexer:
             reset: True이면 기존 컬렉션 삭제 후 재생성
         """
         self.collection_name = collection_name or settings.CHROMA_COLLECTION_NAME
+        self.bulk = False  # bulk_mode() 구간 안에서만 True
+        self._bulk_threads = set()  # PRAGMA를 적용한 스레드 (SQLite 커넥션은 스레드별)
+        # PRAGMA를 바꾼 커넥션과 bulk_mode 진입 전 값 (종료 시 복원)
+        self._bulk_connections: List[Any] = []
+        self._bulk_previous: Optional[Dict[str, Any]] = None
+        # bulk_mode 구간에서 PRAGMA를 실제로 적용한 커넥션이 있었는지 여부
+        self.bulk_pragmas_applied = False
 
         try:
             # ChromaDB 클라이언트 생성
@@ -32,14 +83,18 @@ class ChromaIndexer:
                     self.client.delete_collection(name=self.collection_name)
                 except Exception:
                     pass  # 컬렉션이 없으면 무시
+                self._invalidate_caches(self.collection_name)
 
-            # 컬렉션 생성 또는 가져오기
+            metadata = {
+                "embedding_model": settings.OLLAMA_EMBEDDING_MODEL,
+                "distance_metric": settings.CHROMA_DISTANCE_METRIC,
+                "hnsw:space": settings.CHROMA_DISTANCE_METRIC,  # 실제 HNSW 거리 함수 (생성 시에만 적용)
+                "index_format_version": INDEX_FORMAT_VERSION,
+            }
+            # 컬렉션 생성 또는 가져오기 (기존 컬렉션이면 metadata는 무시됨)
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={
-                    "embedding_model": settings.OLLAMA_EMBEDDING_MODEL,
-                    "distance_metric": settings.CHROMA_DISTANCE_METRIC,
-                }
+                metadata=metadata
             )
 
         except Exception as e:
@@ -48,13 +103,79 @@ class ChromaIndexer:
     def index_chunks(
         self,
         chunks: List[EndpointChunk],
-        embeddings: List[List[float]]
+        embeddings: List[List[float]],
+        documents: Optional[List[str]] = None,
+        index_batch_size: int = 200
     ) -> None:
-        """청크와 임베딩을 ChromaDB에 저장
+        """청크와 임베딩을 ChromaDB에 저장 (index_batch_size 단위로 나눠 add)
 
         Args:
             chunks: 엔드포인트 청크 리스트
             embeddings: 임베딩 벡터 리스트
+            documents: 임베딩에 사용한 텍스트 (없으면 청크에서 생성)
+            index_batch_size: collection.add 1회당 청크 수
+
+        Raises:
+            VectorStoreError: 저장 실패 시
+        """
+        self._write_chunks(chunks, embeddings, documents, index_batch_size, self.collection.add)
+
+    def bulk_index(
+        self,
+        chunks: List[EndpointChunk],
+        embeddings: List[List[float]],
+        documents: Optional[List[str]] = None,
+        index_batch_size: int = 200
+    ) -> None:
+        """Collection.add의 요청 검증을 건너뛰고 클라이언트 내부 API로 직접 저장
+
+        임베딩은 여기서 float32 배열로 만들어지므로 Collection 레벨의 형식 검증이
+        필요 없습니다. 차원/ID 검사는 백엔드가 그대로 수행합니다.
+        내부 API가 없는 Chroma 버전이면 index_chunks로 대체합니다.
+
+        Args:
+            chunks: 엔드포인트 청크 리스트
+            embeddings: 임베딩 벡터 리스트
+            documents: 임베딩에 사용한 텍스트 (없으면 청크에서 생성)
+            index_batch_size: 1회 저장당 청크 수
+
+        Raises:
+            VectorStoreError: 저장 실패 시
+        """
+        client_add = getattr(self.client, "_add", None)
+        if client_add is None:
+            self.index_chunks(chunks, embeddings, documents, index_batch_size)
+            return
+
+        collection_id = self.collection.id
+
+        def add(ids, embeddings, documents, metadatas):
+            client_add(
+                ids=ids,
+                collection_id=collection_id,
+                embeddings=embeddings,
+                metadatas=metadatas,
+                documents=documents
+            )
+
+        self._write_chunks(chunks, embeddings, documents, index_batch_size, add)
+
+    def _write_chunks(
+        self,
+        chunks: List[EndpointChunk],
+        embeddings: List[List[float]],
+        documents: Optional[List[str]],
+        index_batch_size: int,
+        add: Callable[..., Any]
+    ) -> None:
+        """청크 메타데이터를 만들어 서브 배치 단위로 add 호출
+
+        Args:
+            chunks: 엔드포인트 청크 리스트
+            embeddings: 임베딩 벡터 리스트
+            documents: 임베딩에 사용한 텍스트 (없으면 청크에서 생성)
+            index_batch_size: add 1회당 청크 수
+            add: ids/embeddings/documents/metadatas 키워드 인자를 받는 저장 함수
 
         Raises:
             VectorStoreError: 저장 실패 시
@@ -69,40 +190,184 @@ class ChromaIndexer:
             return
 
         try:
-            # 데이터 준비
-            ids = [chunk.chunk_id for chunk in chunks]
-            documents = [chunk.to_embedding_text() for chunk in chunks]
-            metadatas = [self._chunk_to_metadata(chunk) for chunk in chunks]
+            # 임베딩은 float32 배열 하나로 보관 (Chroma 저장 정밀도와 동일)
+            vectors = np.asarray(embeddings, dtype=np.float32)
 
-            # ChromaDB에 저장
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas
-            )
+            # cosine 거리면 단위 벡터로 정규화 (거리 값은 동일, 내적만으로 비교 가능)
+            if settings.CHROMA_DISTANCE_METRIC == "cosine":
+                vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+            step = max(1, index_batch_size)
+
+            if self.bulk:
+                self._apply_bulk_pragmas()
+
+            # ChromaDB에 서브 배치 단위로 저장
+            for start in range(0, len(chunks), step):
+                batch = chunks[start:start + step]
+                n = len(batch)
+
+                # 청크를 한 번만 순회하며 ids/documents/metadatas 채우기
+                ids = [None] * n
+                batch_documents = [None] * n if documents is None else documents[start:start + step]
+                metadatas = [None] * n
+
+                for i, chunk in enumerate(batch):
+                    meta = chunk.metadata
+                    ids[i] = chunk.chunk_id
+                    if documents is None:
+                        batch_documents[i] = chunk.to_embedding_text()
+                    metadata = {
+                        "endpoint": meta.endpoint,
+                        "method": meta.method,
+                        "tags": ",".join(meta.tags),  # 리스트를 문자열로
+                        "operation_id": meta.operation_id or "",
+                        "requires_auth": meta.requires_auth,
+                        "content_type": meta.content_type or "application/json",
+                        "summary": chunk.summary or "",
+                        # 검색 시 전체 청크 복원용 (embedding_text는 document로 저장됨)
+                        "chunk_json": chunk.model_dump_json(by_alias=True, exclude={"embedding_text"}),
+                    }
+                    # 태그마다 불리언 키 저장 (tags 문자열은 부분 일치 검색이 불가)
+                    for tag in meta.tags:
+                        metadata[tag_metadata_key(tag)] = True
+                    metadatas[i] = metadata
+
+                add(
+                    ids=ids,
+                    embeddings=vectors[start:start + step].tolist(),  # 0.4.x는 list만 허용
+                    documents=batch_documents,
+                    metadatas=metadatas
+                )
+
+            self._invalidate_caches()
 
         except Exception as e:
             raise VectorStoreError(f"Failed to index chunks: {e}")
 
-    def _chunk_to_metadata(self, chunk: EndpointChunk) -> Dict[str, Any]:
-        """청크를 ChromaDB 메타데이터로 변환
+    @staticmethod
+    def _invalidate_caches(dropped_collection: Optional[str] = None) -> None:
+        """인덱스가 바뀌었으므로 프롬프트 포맷 캐시와 질의 캐시 무효화
 
         Args:
-            chunk: 엔드포인트 청크
+            dropped_collection: 삭제된 컬렉션 이름 (공유 인덱서의 컬렉션 핸들도 버림)
+        """
+        from src.generation.prompt_builder import PromptBuilder
+        from src.retrieval.query_cache import invalidate_all
+
+        PromptBuilder.clear_cache()
+        invalidate_all()
+
+        if dropped_collection is not None:
+            with _shared_lock:
+                _shared_indexers.pop(dropped_collection, None)
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator["ChromaIndexer"]:
+        """대량 적재 구간 컨텍스트 매니저
+
+        구간 안의 저장 호출에 SQLite 대량 적재 PRAGMA를 적용하고 HNSW 반영을 큰 배치로
+        묶습니다. 종료 시 PRAGMA를 바꾼 커넥션과 HNSW 파라미터를 원래 값으로 되돌립니다.
+        적재 중에는 다른 프로세스가 같은
+        CHROMA_DB_DIR에 접근하면 안 됩니다 (저널이 꺼져 있어 손상 위험).
+        PRAGMA를 적용할 수 없는 Chroma 버전이면 bulk_pragmas_applied가 False로 남습니다.
+
+        Yields:
+            ChromaIndexer: 자기 자신
+        """
+        previous = self.bulk
+        self.bulk = True
+        self.bulk_pragmas_applied = False
+        previous_hnsw = self._set_hnsw_config(_BULK_HNSW_CONFIG)
+        try:
+            yield self
+        finally:
+            self.bulk = previous
+            self._restore_pragmas()
+            self._bulk_threads.clear()
+            if previous_hnsw is not None:
+                self._set_hnsw_config(previous_hnsw)
+
+    def _set_hnsw_config(self, values: Dict[str, int]) -> Optional[Dict[str, int]]:
+        """컬렉션 HNSW 파라미터 변경 (best-effort)
+
+        collection.modify(configuration=...)를 지원하는 Chroma 버전(1.x)에서만 적용되고,
+        그 외 버전에서는 아무것도 바꾸지 않습니다.
+
+        Args:
+            values: 변경할 HNSW 파라미터 (batch_size, sync_threshold)
+
+        Returns:
+            Optional[Dict[str, int]]: 변경 전 값 (변경하지 못했으면 None)
+        """
+        try:
+            current = (self.collection.configuration or {}).get("hnsw") or {}
+            previous = {
+                name: current.get(name, default) for name, default in _DEFAULT_HNSW_CONFIG.items()
+            }
+            self.collection.modify(configuration={"hnsw": dict(values)})
+            return previous
+        except Exception:
+            return None
+
+    def _sqlite_pool(self) -> Optional[Any]:
+        """Chroma 내부 SQLite 커넥션 풀 (Python SQLite 백엔드인 0.4/0.5 계열만 존재)"""
+        sysdb = getattr(getattr(self.client, "_server", None), "_sysdb", None)
+        return getattr(sysdb, "_conn_pool", None)
+
+    def _apply_bulk_pragmas(self) -> bool:
+        """현재 스레드의 SQLite 커넥션에 대량 적재 PRAGMA 적용 (스레드당 1회)
+
+        처음 적용하는 커넥션에서 원래 값을 읽어 두고 bulk_mode 종료 시 _restore_pragmas로
+        모든 커넥션을 그 값으로 복원합니다. journal_mode(WAL)는 DB 파일 단위 설정이라
+        다른 커넥션이 이미 OFF로 바꾼 뒤에 읽으면 원래 값이 아니기 때문입니다.
+        내부 API 접근이므로 실패해도 저장은 계속합니다.
 
         Returns:
-            Dict[str, Any]: ChromaDB 메타데이터
+            bool: 적용되었으면 True
         """
-        return {
-            "endpoint": chunk.metadata.endpoint,
-            "method": chunk.metadata.method,
-            "tags": ",".join(chunk.metadata.tags),  # 리스트를 문자열로
-            "operation_id": chunk.metadata.operation_id or "",
-            "requires_auth": chunk.metadata.requires_auth,
-            "content_type": chunk.metadata.content_type or "application/json",
-            "summary": chunk.summary or "",
-        }
+        thread_id = threading.get_ident()
+        if thread_id in self._bulk_threads:
+            return self.bulk_pragmas_applied
+        self._bulk_threads.add(thread_id)
+
+        pool = self._sqlite_pool()
+        if pool is None:
+            return False
+
+        try:
+            conn = pool.connect()
+            try:
+                if self._bulk_previous is None:
+                    self._bulk_previous = {
+                        name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+                        for name in _BULK_PRAGMAS
+                    }
+                # 일부만 적용된 상태에서 실패해도 복원되도록 먼저 기록
+                self._bulk_connections.append(conn)
+                for name, value in _BULK_PRAGMAS.items():
+                    conn.execute(f"PRAGMA {name}={value}")
+            finally:
+                pool.return_to_pool(conn)
+        except Exception:
+            return False
+
+        self.bulk_pragmas_applied = True
+        return True
+
+    def _restore_pragmas(self) -> None:
+        """bulk_mode에서 바꾼 커넥션의 PRAGMA를 원래 값으로 복원 (best-effort)
+
+        Chroma의 SQLite 커넥션은 스레드 간 공유가 허용되므로(check_same_thread=False)
+        writer 스레드의 커넥션도 여기서 복원합니다.
+        """
+        connections, self._bulk_connections = self._bulk_connections, []
+        previous, self._bulk_previous = self._bulk_previous, None
+        for conn in connections:
+            for name, value in (previous or {}).items():
+                try:
+                    conn.execute(f"PRAGMA {name}={value}")
+                except Exception:
+                    pass
 
     def get_collection_info(self) -> Dict[str, Any]:
         """컬렉션 정보 조회
@@ -130,19 +395,20 @@ class ChromaIndexer:
         """
         try:
             self.client.delete_collection(name=self.collection_name)
+            self._invalidate_caches(self.collection_name)
         except Exception as e:
             raise VectorStoreError(f"Failed to delete collection: {e}")
 
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         top_k: int = 5,
         where: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """유사도 검색
 
         Args:
-            query_embedding: 질의 임베딩 벡터
+            query_embedding: 질의 임베딩 벡터 (float32 배열 또는 리스트)
             top_k: 검색할 개수
             where: 메타데이터 필터
 
@@ -154,7 +420,7 @@ class ChromaIndexer:
         """
         try:
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=[_as_list(query_embedding)],  # 0.4.x는 list만 허용
                 n_results=top_k,
                 where=where
             )
@@ -163,3 +429,51 @@ class ChromaIndexer:
 
         except Exception as e:
             raise VectorStoreError(f"Failed to search: {e}")
+
+    def search_batch(
+        self,
+        query_embeddings: Sequence[Union[np.ndarray, List[float]]],
+        top_k: int = 5,
+        where: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """여러 질의 임베딩을 한 번의 query 호출로 유사도 검색
+
+        Args:
+            query_embeddings: 질의 임베딩 벡터 리스트
+            top_k: 질의별 검색할 개수
+            where: 모든 질의에 공통으로 적용할 메타데이터 필터
+
+        Returns:
+            Dict[str, Any]: 검색 결과 (각 키의 i번째 항목이 i번째 질의 결과)
+
+        Raises:
+            VectorStoreError: 검색 실패 시
+        """
+        try:
+            return self.collection.query(
+                query_embeddings=[_as_list(embedding) for embedding in query_embeddings],
+                n_results=top_k,
+                where=where
+            )
+
+        except Exception as e:
+            raise VectorStoreError(f"Failed to search: {e}")
+
+
+def get_indexer(collection_name: str = None) -> ChromaIndexer:
+    """공유 인덱서 반환 (Chroma 클라이언트와 컬렉션 핸들을 요청 간에 재사용)
+
+    reset 또는 delete_collection으로 컬렉션이 삭제되면 다음 호출에서 새로 만듭니다.
+
+    Args:
+        collection_name: 컬렉션 이름 (기본값: settings.CHROMA_COLLECTION_NAME)
+
+    Returns:
+        ChromaIndexer: 컬렉션별 싱글톤 인덱서
+    """
+    collection_name = collection_name or settings.CHROMA_COLLECTION_NAME
+    with _shared_lock:
+        indexer = _shared_indexers.get(collection_name)
+        if indexer is None:
+            indexer = _shared_indexers[collection_name] = ChromaIndexer(collection_name=collection_name)
+    return indexer
@@ -1,24 +1,39 @@
 """OpenAPI 명세서 파서"""
 
+import mmap
+import os
 import yaml
 import json
+import orjson
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
 
+from openapi_spec_validator import validate as validate_openapi
 from prance import ResolvingParser
 
 from src.core.models import OpenAPISpec
 from src.core.exceptions import SpecParsingError
 
+# libyaml(C) 로더 사용, 미설치 시 순수 Python 로더로 폴백
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# 이 크기를 넘는 파일은 mmap으로 읽음 (작은 파일은 mmap 설정 비용이 더 큼)
+_MMAP_THRESHOLD = 1024 * 1024
+_SPEC_FORMATS = (".yaml", ".yml", ".json")
+
 
 class OpenAPIParser:
     """OpenAPI 명세서 파서 (YAML/JSON)"""
 
-    def parse_file(self, file_path: Union[str, Path]) -> OpenAPISpec:
+    def parse_file(self, file_path: Union[str, Path], trusted: bool = False) -> OpenAPISpec:
         """파일에서 OpenAPI 명세서 파싱 ($ref 자동 해석)
 
         Args:
             file_path: OpenAPI 명세서 파일 경로 (.yaml, .yml, .json)
+            trusted: True이면 Pydantic 검증을 생략 (이미 검증된 내부 명세 전용)
 
         Returns:
             OpenAPISpec: 파싱된 명세서 ($ref 해석 완료)
@@ -32,20 +47,56 @@ class OpenAPIParser:
             raise SpecParsingError(f"File not found: {file_path}")
 
         try:
-            # prance로 $ref 자동 해석
+            # $ref가 없으면 해석할 것이 없으므로 prance를 거치지 않고 바로 로드
+            # (prance와 같은 openapi-spec-validator 검증은 그대로 수행)
+            if file_path.suffix in _SPEC_FORMATS:
+                data = self._load_without_refs(file_path)
+                if data is not None:
+                    validate_openapi(data)
+                    return self.parse_dict(data, trusted=trusted)
+
+            # prance로 $ref 자동 해석 (openapi-spec-validator로 검증)
             parser = ResolvingParser(str(file_path), backend="openapi-spec-validator")
             resolved_spec = parser.specification
 
             # 이미 $ref가 해석된 dict를 Pydantic으로 파싱
-            return self.parse_dict(resolved_spec)
+            return self.parse_dict(resolved_spec, trusted=trusted)
         except Exception as e:
             raise SpecParsingError(f"Failed to read file {file_path}: {e}")
 
-    def parse_string(self, content: str, format: str = ".yaml") -> OpenAPISpec:
+    def _load_without_refs(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """$ref가 없는 명세서 파일을 libyaml/orjson으로 바로 로드
+
+        1MB를 넘는 파일은 mmap으로 읽어 디코딩된 문자열 사본을 만들지 않습니다.
+
+        Args:
+            file_path: 명세서 파일 경로
+
+        Returns:
+            Optional[Dict[str, Any]]: 명세서 딕셔너리 ($ref가 있으면 None)
+        """
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+                content = f.read()
+                if b"$ref" in content:
+                    return None
+                if file_path.suffix == ".json":
+                    return orjson.loads(content)
+                return yaml.load(content, Loader=SafeLoader)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"$ref") != -1:
+                    return None
+                if file_path.suffix == ".json":
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                return yaml.load(mm, Loader=SafeLoader)
+
+    def parse_string(self, content: Union[str, bytes], format: str = ".yaml") -> OpenAPISpec:
         """문자열에서 OpenAPI 명세서 파싱
 
         Args:
-            content: OpenAPI 명세서 문자열
+            content: OpenAPI 명세서 문자열 (UTF-8 bytes도 허용)
             format: 파일 형식 (".yaml", ".yml", ".json")
 
         Returns:
@@ -56,25 +107,26 @@ class OpenAPIParser:
         """
         try:
             if format in [".yaml", ".yml"]:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=SafeLoader)
             elif format == ".json":
-                data = json.loads(content)
+                data = orjson.loads(content)
             else:
                 raise SpecParsingError(f"Unsupported format: {format}")
 
             return self.parse_dict(data)
         except yaml.YAMLError as e:
             raise SpecParsingError(f"YAML parsing error: {e}")
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError 포함
             raise SpecParsingError(f"JSON parsing error: {e}")
         except Exception as e:
             raise SpecParsingError(f"Parsing error: {e}")
 
-    def parse_dict(self, data: Dict[str, Any]) -> OpenAPISpec:
+    def parse_dict(self, data: Dict[str, Any], trusted: bool = False) -> OpenAPISpec:
         """딕셔너리에서 OpenAPI 명세서 파싱
 
         Args:
             data: OpenAPI 명세서 딕셔너리
+            trusted: True이면 Pydantic 검증을 생략 (이미 검증된 내부 명세 전용)
 
         Returns:
             OpenAPISpec: 파싱된 명세서
@@ -94,9 +146,12 @@ class OpenAPIParser:
                     "Only OpenAPI 3.x is supported."
                 )
 
+            # 신뢰할 수 있는 명세는 검증 없이 구성
+            if trusted:
+                return OpenAPISpec.from_trusted(data)
+
             # Pydantic 모델로 검증 및 파싱
-            spec = OpenAPISpec(**data)
-            return spec
+            return OpenAPISpec.model_validate(data)
 
         except Exception as e:
             raise SpecParsingError(f"Failed to parse OpenAPI spec: {e}")
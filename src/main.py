@@ -1,54 +1,101 @@
 """Main CLI for poc-api-spec-rag."""
 
-import click
+import asyncio
+import functools
+import io
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from src.core import settings
+from typing import Any, Awaitable, Callable, Deque, List, Tuple
+
+import click
+from src import _preload
+from src.core import settings, bootstrap
+
+# 디렉토리 인제스트 시 대상 확장자
+_SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+
+
+def _async_command(func: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+    """async 함수를 click 커맨드 콜백으로 쓰도록 이벤트 루프에서 실행"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(func(*args, **kwargs))
+
+    return wrapper
 
 
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """RAG-based API Specification Assistant
 
     OpenAPI 명세서에서 정확한 cURL 명령어를 생성합니다.
     """
-    pass
+    bootstrap()
+
+    # 명령어가 나중에 쓸 무거운 모듈을 백그라운드에서 미리 import
+    _preload.start(ctx.invoked_subcommand)
 
 
 @cli.command()
-@click.argument("spec_file", type=click.Path(exists=True))
+@click.argument("spec_files", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option("--force", is_flag=True, help="기존 데이터 덮어쓰기")
-def ingest(spec_file: str, force: bool):
-    """OpenAPI 명세서를 인제스트합니다.
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="대량 적재 모드 (SQLite 저널/동기화 끔 + HNSW 배치 반영: 빠르지만 중단 시 DB가 손상될 수 있어 --force와 함께 권장)",
+)
+def ingest(spec_files: Tuple[str, ...], force: bool, bulk: bool):
+    """OpenAPI 명세서를 인제스트합니다. (여러 파일 또는 디렉토리 지정 가능)
 
     Examples:
         $ python -m src.main ingest ./specs/payment-api.yaml
         $ python -m src.main ingest ./specs/user-api.json --force
+        $ python -m src.main ingest ./specs/
     """
-    from src.ingestion import OpenAPIParser, EndpointChunker, OllamaEmbedder, ChromaIndexer
-
-    click.echo(f"📥 Ingesting OpenAPI spec: {spec_file}")
+    spec_paths = _collect_spec_files(spec_files)
+    if not spec_paths:
+        click.echo("❌ No OpenAPI spec files found (.yaml, .yml, .json)", err=True)
+        raise click.Abort()
 
-    spec_path = Path(spec_file)
+    for spec_path in spec_paths:
+        click.echo(f"📥 Ingesting OpenAPI spec: {spec_path}")
 
     if force:
         click.echo("⚠️  Force mode: 기존 데이터를 덮어씁니다")
 
     try:
-        # 1. OpenAPI 파싱
+        # 1~2. OpenAPI 파싱 + 엔드포인트 청킹 (파일이 여러 개면 프로세스 병렬)
         click.echo("\n[1/4] Parsing OpenAPI spec...")
-        parser = OpenAPIParser()
-        spec = parser.parse_file(spec_path)
-        parser.validate_spec(spec)
-        click.echo(f"✅ Parsed: {len(spec.paths)} paths")
+        if len(spec_paths) == 1:
+            results = [_parse_and_chunk(spec_paths[0])]
+        else:
+            workers = min(len(spec_paths), os.cpu_count() or 1)
+            _preload.wait()  # import 중인 스레드가 있는 상태로 fork 하지 않도록
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_and_chunk, spec_paths))
+
+        chunks = []
+        for spec_path, (path_count, spec_chunks) in zip(spec_paths, results):
+            if len(spec_paths) > 1:
+                click.echo(f"✅ Parsed {spec_path}: {path_count} paths")
+            else:
+                click.echo(f"✅ Parsed: {path_count} paths")
+            chunks.extend(spec_chunks)
 
-        # 2. 엔드포인트 청킹
         click.echo("\n[2/4] Chunking endpoints...")
-        chunker = EndpointChunker()
-        chunks = chunker.chunk_spec(spec)
         click.echo(f"✅ Created {len(chunks)} chunks")
 
-        # 3. 임베딩 생성
+        # 3. 임베딩 생성 + ChromaDB 저장 (배치 단위 파이프라인)
+        from src.ingestion import OllamaEmbedder, ChromaIndexer
+
         click.echo("\n[3/4] Generating embeddings...")
         embedder = OllamaEmbedder()
 
@@ -56,14 +103,14 @@ def ingest(spec_file: str, force: bool):
         dim = embedder.get_embedding_dimension()
         click.echo(f"   Embedding model: {embedder.model} ({dim} dim)")
 
-        # 배치 임베딩 생성
-        embeddings = embedder.embed_chunks(chunks)
-        click.echo(f"✅ Generated {len(embeddings)} embeddings")
-
-        # 4. ChromaDB 저장
         click.echo("\n[4/4] Indexing to ChromaDB...")
         indexer = ChromaIndexer(reset=force)
-        indexer.index_chunks(chunks, embeddings)
+
+        with indexer.bulk_mode() if bulk else nullcontext():
+            indexed = _embed_and_index(chunks, embedder, indexer, settings.OLLAMA_EMBED_BATCH_SIZE, bulk)
+        if bulk and indexed and not indexer.bulk_pragmas_applied:
+            click.echo("⚠️  SQLite bulk PRAGMAs are not supported by this ChromaDB version (not applied)")
+        click.echo(f"✅ Generated and indexed {indexed} embeddings")
 
         # 저장 결과 확인
         info = indexer.get_collection_info()
@@ -79,6 +126,132 @@ def ingest(spec_file: str, force: bool):
         raise click.Abort()
 
 
+def _collect_spec_files(spec_files: Tuple[str, ...]) -> List[str]:
+    """인자로 받은 파일/디렉토리에서 명세서 파일 목록 생성
+
+    Args:
+        spec_files: 파일 또는 디렉토리 경로
+
+    Returns:
+        List[str]: 명세서 파일 경로 (디렉토리는 확장자로 필터링, 이름순)
+    """
+    spec_paths = []
+
+    for spec_file in spec_files:
+        path = Path(spec_file)
+        if path.is_dir():
+            spec_paths.extend(
+                str(p) for p in sorted(path.iterdir())
+                if p.is_file() and p.suffix in _SPEC_SUFFIXES
+            )
+        else:
+            spec_paths.append(str(path))
+
+    return spec_paths
+
+
+def _parse_and_chunk(spec_path: str) -> Tuple[int, List]:
+    """명세서 하나를 파싱하고 청킹 (프로세스 풀 작업 단위)
+
+    Args:
+        spec_path: 명세서 파일 경로
+
+    Returns:
+        Tuple[int, List]: (경로 수, 청크 리스트)
+
+    Raises:
+        SpecParsingError: 파싱 실패 시
+        ChunkingError: 청킹 실패 시
+    """
+    from src.ingestion import OpenAPIParser, EndpointChunker
+
+    parser = OpenAPIParser()
+    spec = parser.parse_file(spec_path)
+    parser.validate_spec(spec)
+
+    return len(spec.paths), EndpointChunker().chunk_spec(spec)
+
+
+def _embed_and_index(chunks: List, embedder, indexer, batch_size: int, bulk: bool = False) -> int:
+    """배치 임베딩과 ChromaDB 저장을 겹쳐서 수행
+
+    임베딩은 스레드 풀에서 최대 OLLAMA_CONCURRENCY개 배치까지 동시에 요청하고, 완료된 배치는
+    순서대로 큐에 넣어 단일 writer 스레드가 저장합니다 (배치 N 저장 중 N+1 임베딩).
+
+    Args:
+        chunks: 엔드포인트 청크 리스트
+        embedder: OllamaEmbedder
+        indexer: ChromaIndexer
+        batch_size: 배치 크기
+        bulk: True이면 Collection 검증을 건너뛰는 indexer.bulk_index로 저장
+
+    Returns:
+        int: 저장된 청크 수
+
+    Raises:
+        Exception: 임베딩 또는 저장 실패 시 첫 번째 오류
+    """
+    batch_size = max(1, batch_size)
+    batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+
+    # writer 스레드가 한참 뒤처지면 임베딩 결과가 쌓이지 않도록 제한
+    pending: "queue.Queue" = queue.Queue(maxsize=2)
+    errors: List[Exception] = []
+    write = indexer.bulk_index if bulk else indexer.index_chunks
+
+    def write_batches() -> None:
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            if errors:
+                continue  # 실패 이후 배치는 버리고 종료 신호까지 큐만 비움
+            batch, texts, embeddings = item
+            try:
+                write(batch, embeddings, documents=texts)
+            except Exception as e:
+                errors.append(e)
+
+    writer = threading.Thread(target=write_batches, name="chroma-writer", daemon=True)
+    writer.start()
+
+    concurrency = max(1, settings.OLLAMA_CONCURRENCY)
+    # 동시에 요청 중인 배치를 concurrency개로 제한 (완료된 임베딩이 Future에 쌓이지 않도록)
+    in_flight: Deque[Tuple[List, List[str], Future]] = deque()
+
+    def hand_off_oldest() -> None:
+        batch, batch_texts, future = in_flight.popleft()
+        pending.put((batch, batch_texts, future.result()))
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                for batch in batches:
+                    if errors:
+                        break
+                    # 임베딩 텍스트는 한 번만 만들어 임베딩과 저장(documents)에 함께 사용
+                    batch_texts = [chunk.to_embedding_text() for chunk in batch]
+                    future = executor.submit(embedder.embed_batch, batch_texts)
+                    in_flight.append((batch, batch_texts, future))
+                    if len(in_flight) >= concurrency:
+                        hand_off_oldest()
+
+                while in_flight and not errors:
+                    hand_off_oldest()
+            finally:
+                # 실패(임베딩/저장 오류, 중단) 시 아직 시작하지 않은 요청은 취소해 바로 오류를 보고
+                for _, _, future in in_flight:
+                    future.cancel()
+    finally:
+        pending.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+    return len(chunks)
+
+
 @cli.command()
 @click.argument("query")
 @click.option("--top-k", default=5, help="검색할 엔드포인트 개수")
@@ -93,8 +266,6 @@ def query(query: str, top_k: int, verbose: bool, validate: bool):
         $ python -m src.main query "결제 승인" --validate
     """
     from src.retrieval import QueryProcessor, VectorSearcher, LLMReranker
-    from src.generation import PromptBuilder, OllamaLLMClient, OutputParser
-    from src.validation import CurlValidator, SpecValidator, ConfidenceScorer
 
     click.echo(f"🔍 Query: {query}")
 
@@ -137,10 +308,12 @@ def query(query: str, top_k: int, verbose: bool, validate: bool):
             click.echo(f"  - Top result: {top_result.chunk.metadata.method} {top_result.chunk.metadata.endpoint}")
             click.echo(f"  - Similarity: {top_result.similarity_score:.3f}")
 
-        # [2/4] Generation Pipeline
+        # [2/4] Generation Pipeline (검색 중 백그라운드에서 import 됨)
+        from src.generation import PromptBuilder, OutputParser, get_llm_client
+
         click.echo("\n[2/4] Generation Pipeline...")
         builder = PromptBuilder()
-        llm = OllamaLLMClient()
+        llm = get_llm_client()
         parser = OutputParser()
 
         # 프롬프트 구성
@@ -168,72 +341,91 @@ def query(query: str, top_k: int, verbose: bool, validate: bool):
 
         # [3/4] Validation Pipeline (옵션)
         confidence = None
+        spec_skipped = False
         if validate:
+            from src.validation import ConfidenceScorer, get_curl_validator, get_spec_validator
+
             click.echo("\n[3/4] Validation Pipeline...")
-            curl_val = CurlValidator()
-            spec_val = SpecValidator()
+            curl_val = get_curl_validator()
+            spec_val = get_spec_validator()
             scorer = ConfidenceScorer()
 
-            # cURL 문법 검증
-            syntax_valid, syntax_errors = curl_val.validate(gen_resp.curl_command.command)
-            if verbose and syntax_errors:
-                click.echo(f"  - Syntax errors: {syntax_errors}")
-
-            # 명세 준수 검증
-            curl_components = curl_val.get_curl_components(gen_resp.curl_command.command)
-            spec_valid, spec_warnings, spec_completeness = spec_val.validate(
-                curl_components, top_result.chunk
+            # cURL 문법 검증 (구성 요소 분해도 함께)
+            syntax_valid, syntax_errors, curl_components = curl_val.validate_and_parse(
+                gen_resp.curl_command.command
             )
+            if verbose and syntax_errors:
+                click.echo(f"  - Syntax errors: {list(syntax_errors)}")
 
-            if verbose and spec_warnings:
-                click.echo(f"  - Spec warnings: {spec_warnings}")
-
-            # 신뢰도 계산
-            confidence = scorer.calculate_score(
-                similarity=top_result.similarity_score,
-                spec_completeness=spec_completeness,
-                syntax_valid=syntax_valid,
-                spec_valid=spec_valid,
+            # 명세 준수 검증 (결과와 무관하게 신뢰도 레벨이 정해지면 생략)
+            confidence = scorer.score_without_spec_validation(
+                top_result.similarity_score, syntax_valid
             )
-
-            if verbose:
-                click.echo(f"  - Confidence: {confidence.level} ({confidence.overall:.2f})")
-
-        # [4/4] 결과 출력
-        click.echo("\n" + "=" * 60)
-        click.echo("생성된 cURL:")
-        click.echo("=" * 60)
-        click.echo(gen_resp.curl_command.command)
+            spec_skipped = confidence is not None
+            if spec_skipped:
+                if verbose:
+                    click.echo("  - Spec validation skipped (confidence level already determined)")
+                    click.echo(f"  - Confidence: {confidence.level}")
+            else:
+                spec_valid, spec_warnings, spec_completeness = spec_val.validate(
+                    curl_components, top_result.chunk
+                )
+                if verbose and spec_warnings:
+                    click.echo(f"  - Spec warnings: {spec_warnings}")
+
+                # 신뢰도 계산
+                confidence = scorer.calculate_score(
+                    similarity=top_result.similarity_score,
+                    spec_completeness=spec_completeness,
+                    syntax_valid=syntax_valid,
+                    spec_valid=spec_valid,
+                )
+
+                if verbose:
+                    click.echo(f"  - Confidence: {confidence.level} ({confidence.overall:.2f})")
+
+        # [4/4] 결과 출력 (버퍼에 모아 한 번에 출력)
+        out = io.StringIO()
+        out.write("\n" + "=" * 60 + "\n")
+        out.write("생성된 cURL:\n")
+        out.write("=" * 60 + "\n")
+        out.write(gen_resp.curl_command.command + "\n")
 
         if gen_resp.curl_command.explanation:
-            click.echo(f"\n설명:")
-            click.echo(gen_resp.curl_command.explanation)
+            out.write("\n설명:\n")
+            out.write(gen_resp.curl_command.explanation + "\n")
 
         if gen_resp.curl_command.required_params:
-            click.echo(f"\n필수 입력:")
+            out.write("\n필수 입력:\n")
             for param in gen_resp.curl_command.required_params:
-                click.echo(f"  - {param}")
+                out.write(f"  - {param}\n")
 
         if gen_resp.curl_command.expected_responses:
-            click.echo(f"\n예상 응답:")
+            out.write("\n예상 응답:\n")
             for code, desc in gen_resp.curl_command.expected_responses.items():
-                click.echo(f"  - {code}: {desc}")
+                out.write(f"  - {code}: {desc}\n")
 
         # 신뢰도 표시 (--validate 옵션)
         if confidence:
-            click.echo(f"\n신뢰도: {confidence.level.upper()}")
-            click.echo(f"  - 전체 점수: {confidence.overall:.2f}")
-            click.echo(f"  - 검색 유사도: {confidence.similarity:.2f}")
-            click.echo(f"  - 명세 완성도: {confidence.spec_completeness:.2f}")
-            click.echo(f"  - 검증 통과: {'예' if confidence.validation_passed else '아니오'}")
+            out.write(f"\n신뢰도: {confidence.level.upper()}\n")
+            if spec_skipped:
+                # 명세 검증을 하지 않았으므로 측정된 값(레벨, 검색 유사도)만 표시
+                out.write(f"  - 검색 유사도: {confidence.similarity:.2f}\n")
+                out.write("  - 명세 검증: 생략\n")
+            else:
+                out.write(f"  - 전체 점수: {confidence.overall:.2f}\n")
+                out.write(f"  - 검색 유사도: {confidence.similarity:.2f}\n")
+                out.write(f"  - 명세 완성도: {confidence.spec_completeness:.2f}\n")
+                out.write(f"  - 검증 통과: {'예' if confidence.validation_passed else '아니오'}\n")
 
         # 경고 메시지
         if gen_resp.warnings:
-            click.echo("\n⚠️  경고:")
+            out.write("\n⚠️  경고:\n")
             for warn in gen_resp.warnings:
-                click.echo(f"  - {warn}")
+                out.write(f"  - {warn}\n")
 
-        click.echo("\n" + "=" * 60)
+        out.write("\n" + "=" * 60 + "\n")
+        click.echo(out.getvalue(), nl=False)
 
     except Exception as e:
         click.echo(f"\n❌ Query failed: {e}", err=True)
@@ -272,7 +464,8 @@ def info():
 @cli.command()
 @click.option("--host", default="localhost", help="Ollama 호스트")
 @click.option("--port", default=11434, help="Ollama 포트")
-def check(host: str, port: int):
+@_async_command
+async def check(host: str, port: int):
     """Ollama 연결을 확인합니다."""
     import ollama
 
@@ -280,7 +473,8 @@ def check(host: str, port: int):
 
     try:
         # 모델 목록 조회
-        result = ollama.list()
+        client = ollama.AsyncClient(host=f"http://{host}:{port}", timeout=settings.OLLAMA_TIMEOUT)
+        result = await client.list()
         models = result.get("models", [])
 
         click.echo(f"✅ Ollama 서버 연결 성공")
@@ -291,8 +485,8 @@ def check(host: str, port: int):
             size = model.get("size", 0) / (1024**3)  # GB
             click.echo(f"  - {name} ({size:.1f} GB)")
 
-        # 필요한 모델 확인
-        model_names = [m.get("name") for m in models]
+        # 필요한 모델 확인 (이름 집합으로 한 번만 변환)
+        model_names = {m.get("name") for m in models}
 
         click.echo(f"\n필수 모델 확인:")
         embedding_ok = settings.OLLAMA_EMBEDDING_MODEL in model_names
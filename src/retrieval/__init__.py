@@ -3,9 +3,12 @@
 from .query_processor import QueryProcessor
 from .vector_search import VectorSearcher
 from .reranker import LLMReranker
+from .query_cache import QueryCache, invalidate_all
 
 __all__ = [
     "QueryProcessor",
     "VectorSearcher",
     "LLMReranker",
+    "QueryCache",
+    "invalidate_all",
 ]
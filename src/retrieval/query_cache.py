@@ -0,0 +1,98 @@
+"""질의 임베딩 / 검색 결과 캐시"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from src.core.config import settings
+
+# 생성된 모든 캐시 (인덱스 변경 시 한 번에 무효화)
+_registry: "weakref.WeakSet[QueryCache]" = weakref.WeakSet()
+_registry_lock = threading.Lock()
+
+
+class QueryCache:
+    """스레드 안전 LRU + TTL 캐시
+
+    max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    ttl_seconds가 지난 항목은 조회 시 만료 처리합니다.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_size: 최대 항목 수 (기본값: settings.QUERY_CACHE_SIZE, 0이면 캐시 안 함)
+            ttl_seconds: 항목 유효 시간 (기본값: settings.QUERY_CACHE_TTL, 0이면 만료 없음)
+        """
+        self.max_size = settings.QUERY_CACHE_SIZE if max_size is None else max_size
+        self.ttl_seconds = settings.QUERY_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        with _registry_lock:
+            _registry.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료된 항목은 제거 후 default 반환)
+
+        Args:
+            key: 캐시 키
+            default: 항목이 없을 때 반환할 값
+
+        Returns:
+            Any: 캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            stored_at, value = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """캐시 무효화
+
+        Args:
+            key: 제거할 키 (None이면 전체 삭제)
+        """
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def invalidate_all() -> None:
+    """생성된 모든 QueryCache 비우기 (인덱스 변경 시 호출)"""
+    with _registry_lock:
+        caches = list(_registry)
+
+    for cache in caches:
+        cache.invalidate()
@@ -1,10 +1,45 @@
 """질의 처리기"""
 
-from typing import List, Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any
+import numpy as np
 from src.core.models import QueryRequest
 from src.core.config import settings
-from src.ingestion.embedder import OllamaEmbedder
+from src.ingestion.embedder import get_embedder
 from src.core.exceptions import RetrievalError
+from src.retrieval.query_cache import QueryCache
+
+# 연속 공백 (질의 정규화용)
+_WS_RE = re.compile(r"\s+")
+
+# HTTP 메서드 감지 키워드
+_METHOD_KEYWORDS = (
+    ("POST", ("등록", "생성", "추가", "post", "create")),
+    ("GET", ("조회", "확인", "검색", "get", "read", "fetch")),
+    ("PUT", ("수정", "변경", "업데이트", "put", "update")),
+    ("DELETE", ("삭제", "제거", "취소", "delete", "remove", "cancel")),
+    ("PATCH", ("일부수정", "patch")),
+)
+
+# 태그 감지 키워드 (도메인별)
+_TAG_KEYWORDS = (
+    ("payment", ("결제", "payment", "pay")),
+    ("user", ("사용자", "유저", "회원", "user", "member")),
+    ("order", ("주문", "order")),
+    ("product", ("상품", "제품", "product", "item")),
+)
+
+
+def _compile_keywords(table):
+    """키워드 묶음마다 부분 문자열 검색용 정규식 하나로 컴파일"""
+    return tuple(
+        (name, re.compile("|".join(map(re.escape, keywords))))
+        for name, keywords in table
+    )
+
+
+_METHOD_PATTERNS = _compile_keywords(_METHOD_KEYWORDS)
+_TAG_PATTERNS = _compile_keywords(_TAG_KEYWORDS)
 
 
 class QueryProcessor:
@@ -12,7 +47,8 @@ class QueryProcessor:
 
     def __init__(self):
         """Query Processor 초기화"""
-        self.embedder = OllamaEmbedder()
+        self.embedder = get_embedder()
+        self._embed_cache = QueryCache()  # (정규화된 질의, 모델) -> 임베딩
 
     def process_query(
         self,
@@ -39,8 +75,8 @@ class QueryProcessor:
         # 질의 정규화
         normalized_query = self._normalize_query(query)
 
-        # 필터 추출 (질의에서 자동 감지)
-        auto_filters = self._extract_filters(normalized_query)
+        # 필터 추출 (질의에서 자동 감지, 소문자 변환은 여기서 한 번만)
+        auto_filters = self._extract_filters(normalized_query.lower())
 
         # 사용자 필터와 자동 필터 병합
         merged_filters = {**(filters or {}), **auto_filters}
@@ -51,23 +87,58 @@ class QueryProcessor:
             top_k=top_k or settings.TOP_K
         )
 
-    def embed_query(self, query: str) -> List[float]:
+    def embed_query(self, query: str) -> np.ndarray:
         """질의 임베딩 생성
 
         Args:
             query: 질의 문자열
 
         Returns:
-            List[float]: 임베딩 벡터
+            np.ndarray: float32 임베딩 벡터 (캐시와 공유하므로 읽기 전용)
 
         Raises:
             RetrievalError: 임베딩 생성 실패 시
         """
+        key = (self._normalize_query(query), self.embedder.model)
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return self.embedder.embed_text(query)
+            embedding = np.asarray(self.embedder.embed_text(key[0]), dtype=np.float32)
         except Exception as e:
             raise RetrievalError(f"Failed to embed query: {e}")
 
+        embedding.setflags(write=False)
+        self._embed_cache.put(key, embedding)
+        return embedding
+
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """질의 임베딩 생성 (비동기, embed_query와 같은 캐시 사용)
+
+        Args:
+            query: 질의 문자열
+
+        Returns:
+            np.ndarray: float32 임베딩 벡터 (캐시와 공유하므로 읽기 전용)
+
+        Raises:
+            RetrievalError: 임베딩 생성 실패 시
+        """
+        key = (self._normalize_query(query), self.embedder.model)
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            embedding = np.asarray(await self.embedder.aembed_text(key[0]), dtype=np.float32)
+        except Exception as e:
+            raise RetrievalError(f"Failed to embed query: {e}")
+
+        embedding.setflags(write=False)
+        self._embed_cache.put(key, embedding)
+        return embedding
+
     def _normalize_query(self, query: str) -> str:
         """질의 정규화
 
@@ -77,53 +148,31 @@ class QueryProcessor:
         Returns:
             str: 정규화된 질의
         """
-        # 양쪽 공백 제거
-        query = query.strip()
+        # 양쪽 공백 제거 후 연속 공백(탭/개행 포함)을 하나로
+        return _WS_RE.sub(" ", query.strip())
 
-        # 여러 공백을 하나로
-        query = " ".join(query.split())
-
-        return query
-
-    def _extract_filters(self, query: str) -> Dict[str, Any]:
+    def _extract_filters(self, query_lower: str) -> Dict[str, Any]:
         """질의에서 필터 자동 추출
 
+        일치하는 값이 하나면 문자열, 여러 개면 정렬된 리스트로 저장합니다
+        (예: "주문 조회 및 취소" -> method: ["DELETE", "GET"]).
+
         Args:
-            query: 정규화된 질의
+            query_lower: 정규화 후 소문자로 변환한 질의
 
         Returns:
             Dict[str, Any]: 추출된 필터
         """
         filters = {}
-        query_lower = query.lower()
 
         # HTTP 메서드 감지
-        method_keywords = {
-            "post": ["등록", "생성", "추가", "post", "create"],
-            "get": ["조회", "확인", "검색", "get", "read", "fetch"],
-            "put": ["수정", "변경", "업데이트", "put", "update"],
-            "delete": ["삭제", "제거", "취소", "delete", "remove", "cancel"],
-            "patch": ["일부수정", "patch"],
-        }
-
-        for method, keywords in method_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                filters["method"] = method.upper()
-                break
+        methods = [method for method, pattern in _METHOD_PATTERNS if pattern.search(query_lower)]
+        if methods:
+            filters["method"] = methods[0] if len(methods) == 1 else sorted(methods)
 
         # 태그 감지 (도메인별)
-        tag_keywords = {
-            "payment": ["결제", "payment", "pay"],
-            "user": ["사용자", "유저", "회원", "user", "member"],
-            "order": ["주문", "order"],
-            "product": ["상품", "제품", "product", "item"],
-        }
-
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                # tags는 contains 쿼리로 처리
-                if "tags" not in filters:
-                    filters["tags"] = tag
-                break
+        tags = [tag for tag, pattern in _TAG_PATTERNS if pattern.search(query_lower)]
+        if tags:
+            filters["tags"] = tags[0] if len(tags) == 1 else sorted(tags)
 
         return filters
@@ -2,11 +2,43 @@
 
 import re
 import ollama
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from src.core.async_client import LoopLocalAsyncClient
 from src.core.config import settings
 from src.core.models import RetrievalResult
 from src.core.exceptions import GenerationError, OllamaConnectionError
+from src.retrieval.query_cache import QueryCache
+
+# LLM 출력의 선택 번호 ("가장 관련있는 번호: N")
+_RANK_RE = re.compile(r"가장 관련있는 번호:\s*(\d+)")
+_NUMBER_RE = re.compile(r"(\d+)")
+
+# 재정렬 LLM 옵션 (선택 번호와 짧은 이유만 필요)
+_CHAT_OPTIONS = {
+    "temperature": 0.3,  # 약간의 창의성
+    "num_predict": 200,
+}
+
+# 시스템 프롬프트 (호출마다 바이트 단위로 동일해야 Ollama가 프롬프트 prefix KV 캐시를 재사용)
+_SYSTEM_PROMPT = """당신은 API 엔드포인트 매칭 전문가입니다.
+
+사용자 질의와 API 엔드포인트 목록이 주어지면, 가장 관련있는 엔드포인트를 찾습니다.
+
+매칭 규칙:
+- "승인" → approve, POST
+- "취소" → cancel, DELETE
+- "조회" → status/get, GET
+- "생성/등록" → create, POST
+- "수정/변경" → update, PUT
+- "삭제/제거" → delete, DELETE
+
+출력 형식:
+가장 관련있는 번호: N
+이유: [간단한 설명]"""
+
+# 순위 캐시 미스 표시 (None은 "파싱 실패 = 원래 순서"로 캐시됨)
+_MISSING = object()
 
 
 class LLMReranker:
@@ -23,6 +55,14 @@ class LLMReranker:
         """
         self.model = model or settings.OLLAMA_LLM_MODEL
 
+        # 재정렬 호출마다 커넥션을 새로 맺지 않도록 클라이언트 재사용
+        self._client = ollama.Client(
+            host=settings.OLLAMA_BASE_URL,
+            timeout=settings.OLLAMA_TIMEOUT
+        )
+        self._async_client = LoopLocalAsyncClient(settings.OLLAMA_BASE_URL, settings.OLLAMA_TIMEOUT)
+        self._ranking_cache = QueryCache()  # (질의, 후보 chunk_id들) -> 선택 번호
+
     def rerank(
         self,
         query: str,
@@ -43,43 +83,71 @@ class LLMReranker:
             GenerationError: 재정렬 실패 시
             OllamaConnectionError: Ollama 연결 실패 시
         """
-        if not results:
-            return []
-
-        if len(results) == 1:
-            return results
+        shortcut, cache_key = self._precheck(query, results, top_n)
+        if shortcut is not None:
+            return shortcut
 
         try:
-            # LLM 프롬프트 생성
-            prompt = self._build_rerank_prompt(query, results)
+            # LLM 호출 (선택 번호가 나오면 스트림 중단)
+            llm_output = self._stream_until_ranking(self._build_messages(query, results))
+            return self._finish(results, llm_output, cache_key, top_n)
 
-            # LLM 호출
-            response = ollama.chat(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                options={
-                    "temperature": 0.3,  # 약간의 창의성
-                    "num_predict": 200,
-                }
+        except ConnectionError as e:
+            raise OllamaConnectionError(
+                f"Failed to connect to Ollama: {e}"
             )
+        except Exception as e:
+            # Reranking 실패 시 원래 순서 반환
+            print(f"Warning: Reranking failed ({e}), using original order")
+            return results[:top_n]
+
+    async def arerank(
+        self,
+        query: str,
+        results: List[RetrievalResult],
+        top_n: int = 3
+    ) -> List[RetrievalResult]:
+        """검색 결과를 LLM으로 재정렬 (비동기)
+
+        같은 이벤트 루프의 동시 요청은 하나의 커넥션 풀을 공유하므로
+        Ollama가 여러 재정렬 요청을 한 번에 배치 처리할 수 있습니다.
+
+        Args:
+            query: 사용자 질의
+            results: 벡터 검색 결과 리스트
+            top_n: 반환할 상위 결과 개수
+
+        Returns:
+            List[RetrievalResult]: 재정렬된 결과 (상위 top_n개)
 
-            # 응답에서 순위 추출
-            llm_output = response["message"]["content"]
-            ranking = self._parse_ranking(llm_output, len(results))
+        Raises:
+            OllamaConnectionError: Ollama 연결 실패 시
+        """
+        shortcut, cache_key = self._precheck(query, results, top_n)
+        if shortcut is not None:
+            return shortcut
+
+        try:
+            stream = await self._async_client.get().chat(
+                model=self.model,
+                messages=self._build_messages(query, results),
+                stream=True,
+                options=_CHAT_OPTIONS,
+                keep_alive=settings.OLLAMA_KEEP_ALIVE
+            )
 
-            # 결과 재정렬
-            reranked = self._apply_ranking(results, ranking)
+            text = ""
+            try:
+                async for chunk in stream:
+                    text += chunk["message"]["content"]
+                    if self._ranking_complete(text):
+                        break
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
 
-            return reranked[:top_n]
+            return self._finish(results, text, cache_key, top_n)
 
         except ConnectionError as e:
             raise OllamaConnectionError(
@@ -90,27 +158,129 @@ class LLMReranker:
             print(f"Warning: Reranking failed ({e}), using original order")
             return results[:top_n]
 
-    def _get_system_prompt(self) -> str:
-        """시스템 프롬프트 생성
+    def _precheck(
+        self,
+        query: str,
+        results: List[RetrievalResult],
+        top_n: int
+    ) -> Tuple[Optional[List[RetrievalResult]], Tuple[str, Tuple[str, ...]]]:
+        """LLM 호출 없이 결정할 수 있는 경우 처리
+
+        Args:
+            query: 사용자 질의
+            results: 벡터 검색 결과 리스트
+            top_n: 반환할 상위 결과 개수
 
         Returns:
-            str: 시스템 프롬프트
+            Tuple: (LLM 없이 정해진 결과 또는 None, 순위 캐시 키)
         """
-        return """당신은 API 엔드포인트 매칭 전문가입니다.
+        cache_key = (query, tuple(r.chunk.chunk_id for r in results))
 
-사용자 질의와 API 엔드포인트 목록이 주어지면, 가장 관련있는 엔드포인트를 찾습니다.
+        if len(results) <= 1:
+            return results, cache_key
 
-매칭 규칙:
-- "승인" → approve, POST
-- "취소" → cancel, DELETE
-- "조회" → status/get, GET
-- "생성/등록" → create, POST
-- "수정/변경" → update, PUT
-- "삭제/제거" → delete, DELETE
+        # 벡터 유사도만으로 1위가 확실하면 LLM 호출 생략
+        if results[0].similarity_score - results[1].similarity_score >= settings.RERANK_SKIP_GAP:
+            return results[:top_n], cache_key
 
-출력 형식:
-가장 관련있는 번호: N
-이유: [간단한 설명]"""
+        top_choice = self._ranking_cache.get(cache_key, _MISSING)
+        if top_choice is not _MISSING:
+            return self._apply_ranking(results, top_choice)[:top_n], cache_key
+
+        return None, cache_key
+
+    def _build_messages(self, query: str, results: List[RetrievalResult]) -> List[Dict[str, str]]:
+        """재정렬 chat 메시지 구성
+
+        Args:
+            query: 사용자 질의
+            results: 검색 결과
+
+        Returns:
+            List[Dict[str, str]]: 시스템 + 사용자 메시지
+        """
+        return [
+            {
+                "role": "system",
+                "content": self._get_system_prompt()
+            },
+            {
+                "role": "user",
+                "content": self._build_rerank_prompt(query, results)
+            }
+        ]
+
+    def _finish(
+        self,
+        results: List[RetrievalResult],
+        llm_output: str,
+        cache_key: Tuple[str, Tuple[str, ...]],
+        top_n: int
+    ) -> List[RetrievalResult]:
+        """LLM 출력에서 선택 번호를 파싱해 캐시하고 결과 재정렬
+
+        Args:
+            results: 검색 결과
+            llm_output: LLM 응답 텍스트
+            cache_key: 순위 캐시 키
+            top_n: 반환할 상위 결과 개수
+
+        Returns:
+            List[RetrievalResult]: 재정렬된 결과 (상위 top_n개)
+        """
+        top_choice = self._parse_ranking(llm_output, len(results))
+        self._ranking_cache.put(cache_key, top_choice)
+        return self._apply_ranking(results, top_choice)[:top_n]
+
+    @staticmethod
+    def _ranking_complete(text: str) -> bool:
+        """선택 번호가 끝까지 출력되었는지 확인
+
+        숫자 뒤에 다른 문자가 와야 번호가 끝난 것 ("1" 뒤에 "2"가 이어질 수 있음)
+        """
+        match = _RANK_RE.search(text)
+        return match is not None and match.end() < len(text)
+
+    def _stream_until_ranking(self, messages: List[Dict[str, str]]) -> str:
+        """스트리밍으로 LLM을 호출하고 선택 번호가 나오는 즉시 중단
+
+        번호 형식이 끝까지 나오지 않으면 전체 출력을 반환합니다 (대체 파싱용).
+
+        Args:
+            messages: chat 메시지 목록
+
+        Returns:
+            str: 지금까지 수신한 LLM 출력
+        """
+        stream = self._client.chat(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            options=_CHAT_OPTIONS,
+            keep_alive=settings.OLLAMA_KEEP_ALIVE
+        )
+
+        text = ""
+        try:
+            for chunk in stream:
+                text += chunk["message"]["content"]
+                if self._ranking_complete(text):
+                    break
+        finally:
+            # 소비를 멈춘 스트림을 닫아 HTTP 연결 종료 (서버도 생성 중단)
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        return text
+
+    def _get_system_prompt(self) -> str:
+        """시스템 프롬프트 조회
+
+        Returns:
+            str: 시스템 프롬프트
+        """
+        return _SYSTEM_PROMPT
 
     def _build_rerank_prompt(
         self,
@@ -148,62 +318,47 @@ API 엔드포인트 목록:
 
         return prompt
 
-    def _parse_ranking(self, llm_output: str, num_results: int) -> List[int]:
-        """LLM 출력에서 순위 파싱
+    def _parse_ranking(self, llm_output: str, num_results: int) -> Optional[int]:
+        """LLM 출력에서 선택된 번호 파싱
 
         Args:
             llm_output: LLM 응답 텍스트
             num_results: 결과 개수
 
         Returns:
-            List[int]: 순위 리스트 (1-indexed)
+            Optional[int]: 1위로 올릴 결과 번호 (1-indexed), 파싱 실패 시 None
         """
-        # "가장 관련있는 번호: N" 형식 파싱
-        match = re.search(r'가장 관련있는 번호:\s*(\d+)', llm_output)
-        if match:
-            top_choice = int(match.group(1))
-            if 1 <= top_choice <= num_results:
-                # 선택된 번호를 1위로, 나머지는 원래 순서
-                ranking = [top_choice]
-                for i in range(1, num_results + 1):
-                    if i != top_choice:
-                        ranking.append(i)
-                return ranking
-
-        # 대체: 첫 번째 숫자 찾기
-        numbers = re.findall(r'\d+', llm_output)
-        if numbers:
-            top_choice = int(numbers[0])
-            if 1 <= top_choice <= num_results:
-                ranking = [top_choice]
-                for i in range(1, num_results + 1):
-                    if i != top_choice:
-                        ranking.append(i)
-                return ranking
+        # "가장 관련있는 번호: N" 형식 파싱, 대체: 첫 번째 숫자
+        for pattern in (_RANK_RE, _NUMBER_RE):
+            match = pattern.search(llm_output)
+            if match:
+                top_choice = int(match.group(1))
+                if 1 <= top_choice <= num_results:
+                    return top_choice
 
         # 파싱 실패 시 원래 순서
-        return list(range(1, num_results + 1))
+        return None
 
     def _apply_ranking(
         self,
         results: List[RetrievalResult],
-        ranking: List[int]
+        top_choice: Optional[int]
     ) -> List[RetrievalResult]:
-        """순위를 결과에 적용
+        """선택된 결과를 1위로 올리고 나머지는 원래 순서 유지
 
         Args:
             results: 원본 결과
-            ranking: 순위 리스트 (1-indexed)
+            top_choice: 1위로 올릴 결과 번호 (1-indexed, None이면 원래 순서)
 
         Returns:
             List[RetrievalResult]: 재정렬된 결과
         """
-        reranked = []
-        for rank_position, original_position in enumerate(ranking, 1):
-            if original_position <= len(results):
-                result = results[original_position - 1]
-                # rank 업데이트
-                result.rank = rank_position
-                reranked.append(result)
+        if top_choice is None or top_choice == 1:
+            return results
+
+        reranked = [results[top_choice - 1]] + results[:top_choice - 1] + results[top_choice:]
+        # rank 업데이트 (선택된 결과 위쪽만 바뀜)
+        for rank_position, result in enumerate(reranked[:top_choice], 1):
+            result.rank = rank_position
 
         return reranked
@@ -1,18 +1,24 @@
 """벡터 검색"""
 
-from typing import List, Optional, Dict, Any
-import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Hashable, Sequence, Union
+import numpy as np
+import orjson
 
 from src.core.models import (
     QueryRequest,
     RetrievalResult,
     RetrievalResponse,
     EndpointChunk,
-    ChunkMetadata,
 )
 from src.core.config import settings
-from src.ingestion.indexer import ChromaIndexer
+from src.ingestion.indexer import get_indexer, tag_metadata_key
 from src.core.exceptions import RetrievalError
+from src.retrieval.query_cache import QueryCache
+
+# 필터가 다른 질의 묶음을 동시에 검색할 최대 스레드 수
+_BATCH_SEARCH_WORKERS = 4
 
 
 class VectorSearcher:
@@ -24,19 +30,21 @@ class VectorSearcher:
             collection_name: 컬렉션 이름
         """
         try:
-            self.indexer = ChromaIndexer(collection_name=collection_name)
+            self.indexer = get_indexer(collection_name)
         except Exception as e:
             raise RetrievalError(f"Failed to initialize searcher: {e}")
 
+        self._result_cache = QueryCache()  # (임베딩 해시, 질의, top_k, 필터) -> 결과 리스트
+
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, Sequence[float]],
         query_request: QueryRequest
     ) -> RetrievalResponse:
         """벡터 유사도 검색
 
         Args:
-            query_embedding: 질의 임베딩
+            query_embedding: 질의 임베딩 (float32 배열 또는 리스트)
             query_request: 질의 요청
 
         Returns:
@@ -45,6 +53,11 @@ class VectorSearcher:
         Raises:
             RetrievalError: 검색 실패 시
         """
+        cache_key = self._result_cache_key(query_embedding, query_request)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return self._build_response(cached, query_request.query)
+
         try:
             # 메타데이터 필터 변환
             where = self._build_where_clause(query_request.filters)
@@ -59,23 +72,173 @@ class VectorSearcher:
             # 결과 변환
             retrieval_results = self._parse_results(results, query_request.query)
 
-            return RetrievalResponse(
-                results=retrieval_results,
-                query=query_request.query,
-                total_results=len(retrieval_results)
-            )
+            # 태그가 맞는 결과가 없으면 태그 추출이 빗나간 것으로 보고 태그 조건 없이 재검색
+            if not retrieval_results and self._has_tag_filter(query_request.filters):
+                results = self.indexer.search(
+                    query_embedding=query_embedding,
+                    top_k=query_request.top_k,
+                    where=self._build_where_clause(query_request.filters, include_tags=False)
+                )
+                retrieval_results = self._parse_results(results, query_request.query)
 
         except Exception as e:
             raise RetrievalError(f"Search failed: {e}")
 
+        self._result_cache.put(cache_key, retrieval_results)
+        return self._build_response(retrieval_results, query_request.query)
+
+    def batch_search(
+        self,
+        query_embeddings: Sequence[Union[np.ndarray, Sequence[float]]],
+        query_requests: List[QueryRequest]
+    ) -> List[RetrievalResponse]:
+        """여러 질의를 한 번에 벡터 검색
+
+        필터와 top_k가 같은 질의끼리 묶어 ChromaDB query 한 번으로 검색하고,
+        묶음이 여러 개면 스레드 풀에서 동시에 실행합니다.
+
+        Args:
+            query_embeddings: 질의 임베딩 리스트
+            query_requests: 질의 요청 리스트 (query_embeddings와 같은 순서)
+
+        Returns:
+            List[RetrievalResponse]: 질의별 검색 결과 (입력 순서 유지)
+
+        Raises:
+            RetrievalError: 검색 실패 시
+        """
+        if len(query_embeddings) != len(query_requests):
+            raise RetrievalError(
+                f"Embeddings ({len(query_embeddings)}) and requests ({len(query_requests)}) "
+                "count mismatch"
+            )
+
+        results: List[Optional[List[RetrievalResult]]] = [None] * len(query_requests)
+        cache_keys = [
+            self._result_cache_key(embedding, request)
+            for embedding, request in zip(query_embeddings, query_requests)
+        ]
+
+        # 캐시에 없는 질의를 (where, top_k)별로 묶기
+        groups: Dict[Hashable, List[int]] = {}
+        for i, (cache_key, request) in enumerate(zip(cache_keys, query_requests)):
+            results[i] = self._result_cache.get(cache_key)
+            if results[i] is None:
+                where = self._build_where_clause(request.filters)
+                group_key = (orjson.dumps(where, option=orjson.OPT_SORT_KEYS), request.top_k)
+                groups.setdefault(group_key, []).append(i)
+
+        def search_indices(indices: List[int], where: Optional[Dict[str, Any]]) -> None:
+            chroma_results = self.indexer.search_batch(
+                query_embeddings=[query_embeddings[i] for i in indices],
+                top_k=query_requests[indices[0]].top_k,
+                where=where
+            )
+            for j, i in enumerate(indices):
+                results[i] = self._parse_results(
+                    self._select_query(chroma_results, j), query_requests[i].query
+                )
+
+        def search_group(indices: List[int]) -> None:
+            filters = query_requests[indices[0]].filters
+            search_indices(indices, self._build_where_clause(filters))
+
+            # 태그가 맞는 결과가 없는 질의만 태그 조건 없이 재검색
+            if self._has_tag_filter(filters):
+                empty = [i for i in indices if not results[i]]
+                if empty:
+                    search_indices(empty, self._build_where_clause(filters, include_tags=False))
+
+            for i in indices:
+                self._result_cache.put(cache_keys[i], results[i])
+
+        try:
+            if len(groups) > 1:
+                with ThreadPoolExecutor(max_workers=_BATCH_SEARCH_WORKERS) as executor:
+                    list(executor.map(search_group, groups.values()))
+            else:
+                for indices in groups.values():
+                    search_group(indices)
+
+        except Exception as e:
+            raise RetrievalError(f"Batch search failed: {e}")
+
+        return [
+            self._build_response(retrieval_results, request.query)
+            for retrieval_results, request in zip(results, query_requests)
+        ]
+
+    @staticmethod
+    def _select_query(chroma_results: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """다중 질의 결과에서 index번째 질의의 결과만 단일 질의 형태로 추출
+
+        Args:
+            chroma_results: ChromaDB 다중 질의 검색 결과
+            index: 질의 위치
+
+        Returns:
+            Dict[str, Any]: {'ids': [[...]], 'distances': [[...]], ...}
+        """
+        return {
+            key: [chroma_results[key][index]]
+            for key in ("ids", "distances", "metadatas", "documents")
+            if chroma_results.get(key)
+        }
+
+    def _result_cache_key(
+        self,
+        query_embedding: Union[np.ndarray, Sequence[float]],
+        query_request: QueryRequest
+    ) -> Hashable:
+        """검색 결과 캐시 키 생성
+
+        Args:
+            query_embedding: 질의 임베딩
+            query_request: 질의 요청
+
+        Returns:
+            Hashable: (임베딩 해시, 질의, top_k, 필터 JSON)
+        """
+        vector = np.asarray(query_embedding, dtype=np.float32)
+        digest = hashlib.blake2b(vector.tobytes(), digest_size=16).hexdigest()
+        filters = orjson.dumps(query_request.filters, option=orjson.OPT_SORT_KEYS)
+        return (digest, query_request.query, query_request.top_k, filters)
+
+    def _build_response(
+        self,
+        results: List[RetrievalResult],
+        query: str
+    ) -> RetrievalResponse:
+        """검색 결과로 응답 생성
+
+        재정렬이 rank를 직접 바꾸므로 캐시된 결과는 복사해서 전달합니다.
+
+        Args:
+            results: 검색 결과 리스트
+            query: 질의
+
+        Returns:
+            RetrievalResponse: 검색 응답
+        """
+        results = [result.model_copy() for result in results]
+        return RetrievalResponse.from_trusted({
+            "results": results,
+            "query": query,
+            "total_results": len(results),
+        })
+
     def _build_where_clause(
         self,
-        filters: Optional[Dict[str, Any]]
+        filters: Optional[Dict[str, Any]],
+        include_tags: bool = True
     ) -> Optional[Dict[str, Any]]:
         """메타데이터 필터 조건 생성
 
+        method/tags는 문자열 하나 또는 리스트를 받으며, 리스트는 값 중 하나라도 일치하면 통과합니다.
+
         Args:
             filters: 필터 딕셔너리
+            include_tags: False이면 tags 조건 제외 (태그 조건 결과가 없을 때 재검색용)
 
         Returns:
             Optional[Dict[str, Any]]: ChromaDB where 조건
@@ -86,13 +249,21 @@ class VectorSearcher:
         conditions = []
 
         # method 필터
-        if "method" in filters:
-            conditions.append({"method": {"$eq": filters["method"]}})
-
-        # tags 필터 (문자열 포함 검색은 지원하지 않으므로 제거하거나 정확한 일치만 사용)
-        # ChromaDB의 제한으로 인해 tags 필터는 현재 비활성화
-        # if "tags" in filters:
-        #     conditions.append({"tags": {"$eq": filters["tags"]}})
+        methods = self._as_values(filters.get("method"))
+        if methods:
+            if len(methods) == 1:
+                conditions.append({"method": {"$eq": methods[0]}})
+            else:
+                conditions.append({"method": {"$in": methods}})
+
+        # tags 필터 (인덱싱 시 저장한 태그별 불리언 키로 검색)
+        tags = self._as_values(filters.get("tags")) if include_tags else []
+        if tags:
+            tag_conditions = [{tag_metadata_key(tag): {"$eq": True}} for tag in tags]
+            if len(tag_conditions) == 1:
+                conditions.append(tag_conditions[0])
+            else:
+                conditions.append({"$or": tag_conditions})
 
         # requires_auth 필터
         if "requires_auth" in filters:
@@ -112,6 +283,26 @@ class VectorSearcher:
         else:
             return {"$and": conditions}
 
+    @staticmethod
+    def _as_values(value: Any) -> List[Any]:
+        """필터 값(단일 값 또는 리스트)을 리스트로 변환"""
+        if value is None:
+            return []
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sorted(value)
+        return [value]
+
+    def _has_tag_filter(self, filters: Optional[Dict[str, Any]]) -> bool:
+        """tags 필터가 있는지 확인
+
+        Args:
+            filters: 필터 딕셔너리
+
+        Returns:
+            bool: tags 조건이 where에 포함되면 True
+        """
+        return bool(filters) and bool(self._as_values(filters.get("tags")))
+
     def _parse_results(
         self,
         chroma_results: Dict[str, Any],
@@ -126,35 +317,30 @@ class VectorSearcher:
         Returns:
             List[RetrievalResult]: 변환된 결과 리스트
         """
-        retrieval_results = []
-
         # ChromaDB 결과 구조: {'ids': [[...]], 'distances': [[...]], 'metadatas': [[...]], 'documents': [[...]]}
         ids = chroma_results.get("ids", [[]])[0]
         distances = chroma_results.get("distances", [[]])[0]
         metadatas = chroma_results.get("metadatas", [[]])[0]
         documents = chroma_results.get("documents", [[]])[0]
 
-        for rank, (chunk_id, distance, metadata, document) in enumerate(
-            zip(ids, distances, metadatas, documents), start=1
-        ):
-            # Distance를 유사도로 변환 (cosine distance: 0=identical, 2=opposite)
-            # Similarity = 1 - (distance / 2)
-            similarity_score = 1.0 - (distance / 2.0)
-
-            # 유사도 임계값 체크
-            if similarity_score < settings.SIMILARITY_THRESHOLD:
-                continue
+        # Distance를 유사도로 변환 (cosine distance: 0=identical, 2=opposite)
+        # Similarity = 1 - (distance / 2), 임계값 미만은 한 번에 걸러냄
+        n = min(len(ids), len(distances), len(metadatas), len(documents))
+        similarities = 1.0 - np.asarray(distances[:n], dtype=np.float64) * 0.5
+        keep = np.flatnonzero(similarities >= settings.SIMILARITY_THRESHOLD).tolist()
+        similarities = similarities.tolist()
 
+        # 통과한 개수만큼 미리 할당해 채움 (append 재할당 없음)
+        retrieval_results: List[RetrievalResult] = [None] * len(keep)
+        for slot, i in enumerate(keep):
             # EndpointChunk 재구성
-            chunk = self._reconstruct_chunk(chunk_id, metadata, document)
+            chunk = self._reconstruct_chunk(ids[i], metadatas[i], documents[i])
 
-            retrieval_results.append(
-                RetrievalResult(
-                    chunk=chunk,
-                    similarity_score=similarity_score,
-                    rank=rank
-                )
-            )
+            retrieval_results[slot] = RetrievalResult.from_trusted({
+                "chunk": chunk,
+                "similarity_score": similarities[i],
+                "rank": i + 1,
+            })
 
         return retrieval_results
 
@@ -174,7 +360,14 @@ class VectorSearcher:
         Returns:
             EndpointChunk: 재구성된 청크
         """
-        # method와 path 추출
+        # 전체 청크가 저장되어 있으면 그대로 복원
+        chunk_json = metadata.get("chunk_json")
+        if chunk_json:
+            data = orjson.loads(chunk_json)
+            data["embedding_text"] = document  # 저장된 문서 = to_embedding_text() 결과
+            return EndpointChunk.from_trusted(data)
+
+        # 이전 버전 인덱스: 메타데이터만으로 최소 정보 재구성
         method = metadata.get("method", "")
         endpoint = metadata.get("endpoint", "")
 
@@ -182,28 +375,26 @@ class VectorSearcher:
         tags_str = metadata.get("tags", "")
         tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
 
-        # ChunkMetadata 생성
-        chunk_metadata = ChunkMetadata(
-            endpoint=endpoint,
-            method=method,
-            tags=tags,
-            operation_id=metadata.get("operation_id") or None,
-            requires_auth=metadata.get("requires_auth", False),
-            content_type=metadata.get("content_type", "application/json")
-        )
-
-        # EndpointChunk 생성 (최소 정보만)
-        chunk = EndpointChunk(
-            chunk_id=chunk_id,
-            method=method,
-            path=endpoint,
-            summary=metadata.get("summary") or None,
-            description=None,  # 전체 정보는 나중에 필요시 로드
-            parameters=[],
-            request_body=None,
-            responses={},
-            metadata=chunk_metadata
-        )
+        # EndpointChunk 생성 (최소 정보만, 자체 저장 데이터이므로 검증 생략)
+        chunk = EndpointChunk.from_trusted({
+            "chunk_id": chunk_id,
+            "method": method,
+            "path": endpoint,
+            "summary": metadata.get("summary") or None,
+            "description": None,  # 전체 정보는 나중에 필요시 로드
+            "parameters": [],
+            "request_body": None,
+            "responses": {},
+            "metadata": {
+                "endpoint": endpoint,
+                "method": method,
+                "tags": tags,
+                "operation_id": metadata.get("operation_id") or None,
+                "requires_auth": metadata.get("requires_auth", False),
+                "content_type": metadata.get("content_type", "application/json"),
+            },
+            "embedding_text": document,  # 저장된 문서 = to_embedding_text() 결과
+        })
 
         return chunk
 
@@ -1,11 +1,13 @@
 """Validation 패키지 - cURL 검증 및 신뢰도 점수 계산"""
 
-from src.validation.curl_validator import CurlValidator
-from src.validation.spec_validator import SpecValidator
+from src.validation.curl_validator import CurlValidator, get_curl_validator
+from src.validation.spec_validator import SpecValidator, get_spec_validator
 from src.validation.confidence_scorer import ConfidenceScorer
 
 __all__ = [
     "CurlValidator",
     "SpecValidator",
     "ConfidenceScorer",
+    "get_curl_validator",
+    "get_spec_validator",
 ]
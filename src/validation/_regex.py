@@ -0,0 +1,34 @@
+"""검증용 정규식 엔진 선택
+
+기본은 표준 re입니다. settings.VALIDATION_REGEX_ENGINE이 "re2"이고 google-re2가 설치되어 있으면
+RE2(입력 길이에 선형 시간 보장)로 컴파일해 신뢰할 수 없는 긴 cURL 입력의 ReDoS를 막습니다.
+검증 패턴은 역참조/전후방 탐색이 없어 두 엔진에서 같게 동작하지만, RE2는 str <-> UTF-8 변환
+비용 때문에 짧은 명령어에서는 re보다 느립니다.
+"""
+
+import re
+from typing import Any
+
+from src.core.config import settings
+
+_engine = re
+if settings.VALIDATION_REGEX_ENGINE == "re2":
+    try:
+        import re2 as _engine
+    except ImportError:
+        pass
+
+# 현재 사용 중인 엔진 이름 ("re2" 또는 "re")
+ENGINE = _engine.__name__
+
+
+def compile_pattern(pattern: str) -> Any:
+    """선택된 엔진으로 패턴 컴파일
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        Any: 컴파일된 패턴 (re.Pattern 또는 re2 패턴, 둘 다 search/findall/finditer/sub 제공)
+    """
+    return _engine.compile(pattern)
@@ -1,6 +1,6 @@
 """신뢰도 점수 계산 모듈"""
 
-from typing import List
+from typing import List, Optional
 
 from src.core.models import ConfidenceScore
 
@@ -41,6 +41,26 @@ class ConfidenceScorer:
             validation_passed=validation_passed,
         )
 
+    def score_without_spec_validation(
+        self, similarity: float, syntax_valid: bool
+    ) -> Optional[ConfidenceScore]:
+        """명세 검증 없이 신뢰도 레벨이 정해지는 경우 그 점수를 반환
+
+        명세 검증이 가장 나쁜 경우(완성도 0, 불통과)와 가장 좋은 경우(완성도 1, 통과)의
+        레벨이 같으면 검증 결과와 무관하게 레벨이 정해지므로 검증을 생략할 수 있습니다.
+        반환된 점수의 레벨만 의미가 있고, 명세 완성도와 전체 점수는 측정된 값이 아닙니다.
+
+        Args:
+            similarity: 벡터 검색 유사도 (0-1)
+            syntax_valid: cURL 문법 유효성
+
+        Returns:
+            Optional[ConfidenceScore]: 가장 나쁜 경우의 점수 (명세 검증이 필요하면 None)
+        """
+        worst = self.calculate_score(similarity, 0.0, syntax_valid, False)
+        best = self.calculate_score(similarity, 1.0, syntax_valid, True)
+        return worst if worst.level == best.level else None
+
     def get_confidence_explanation(self, confidence: ConfidenceScore) -> str:
         """
         신뢰도 점수 설명 생성
@@ -1,16 +1,183 @@
 """cURL 명령어 문법 검증 모듈"""
 
-import re
-from typing import List, Tuple
+import functools
+from typing import List, Optional, Tuple
 
 from src.core.exceptions import ValidationError
+from src.core.models import CurlComponents
+from src.validation import _regex
+
+# 큰따옴표 안의 옵션 값 (이스케이프된 \" 허용, 선형 시간으로 매칭되도록 풀어 쓴 형태)
+_QUOTED = r'"({}[^"\\]*(?:\\.[^"\\]*)*)"'
+
+# 옵션 스캐너: -X/--request, -H/--header, -d/--data/--data-raw 값을 한 번의 패스로 찾음
+# (그룹 이름 = 옵션 종류, 같은 종류의 긴/짧은 옵션은 그룹이 다름, 옵션과 값은 같은 줄에 있어야 함)
+_OPTION_RE = _regex.compile_pattern(
+    r"-X[ \t]+(?P<method>\w+)|--request[ \t]+(?P<method_long>\w+)"
+    r"|-H[ \t]+" + _QUOTED.format("?P<header>")
+    + r"|--header[ \t]+" + _QUOTED.format("?P<header_long>")
+    + r"|-d[ \t]+" + _QUOTED.format("?P<body>")
+    + r"|--data[ \t]+" + _QUOTED.format("?P<body_long>")
+    + r"|--data-raw[ \t]+" + _QUOTED.format("?P<body_raw>")
+)
+_OPTION_KINDS = {
+    "method": "method",
+    "method_long": "method",
+    "header": "header",
+    "header_long": "header",
+    "body": "body",
+    "body_long": "body",
+    "body_raw": "body",
+}
+
+# URL 패턴: 실제 URL | 플레이스홀더 (예: <BASE_URL>/path) | 환경변수 (예: ${BASE_URL}/path)
+# 그룹 번호가 작을수록 우선 (한 번의 스캔으로 모든 후보를 찾은 뒤 우선순위로 선택)
+# URL은 공백이나 따옴표에서 끝남 (따옴표로 감싼 URL에서 닫는 따옴표를 포함하지 않음)
+_URL_COMBINED_RE = _regex.compile_pattern(
+    r"(https?://[^\s'\"]+)"
+    r"|(<[A-Z_]+>(?:/[^\s'\"]*)?)"
+    r"|(\$\{[A-Z_]+\}(?:/[^\s'\"]*)?)"
+)
+
+# 지원되는 HTTP 메서드
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+# 검증 결과 캐시 크기 (같은 명령어 재검증 시 정규식 스캔 생략)
+_PARSE_CACHE_SIZE = 512
+
+
+def _find_url(command: str) -> Optional[str]:
+    """명령어에서 URL 추출 (실제 URL > 플레이스홀더 > 환경변수 순, 같은 종류는 앞쪽 우선)"""
+    # 세 패턴 모두 필요한 리터럴이 없으면 정규식 스캔 생략
+    if "://" not in command and "<" not in command and "${" not in command:
+        return None
+
+    best = None
+    for match in _URL_COMBINED_RE.finditer(command):
+        if match.lastindex == 1:
+            return match.group(1)
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+
+    return best.group(best.lastindex) if best else None
+
+
+def _starts_with_curl(command: str) -> bool:
+    """curl로 시작하는지 확인"""
+    stripped = command.strip()
+    return stripped.startswith("curl ")
+
+
+def _validate_method(methods: List[str]) -> Tuple[bool, List[str]]:
+    """HTTP 메서드 검증 (-X / --request 값 목록)"""
+    errors = []
+
+    if not methods:
+        # 메서드가 명시되지 않았으면 기본값 GET (valid)
+        return True, []
+
+    for method in methods:
+        # 보통 이미 대문자이므로 그대로 조회하고, 없을 때만 대문자로 변환해 다시 조회
+        if method not in _VALID_METHODS and method.upper() not in _VALID_METHODS:
+            errors.append(f"지원되지 않는 HTTP 메서드: {method}")
+
+    return len(errors) == 0, errors
+
+
+def _validate_url(url: Optional[str]) -> Tuple[bool, List[str]]:
+    """URL 존재 확인 (실제 URL, 플레이스홀더 또는 환경변수)"""
+    if url is None:
+        return False, ["URL이 명시되지 않았습니다"]
+
+    return True, []
+
+
+def _validate_headers(headers: Tuple[str, ...]) -> Tuple[bool, List[str]]:
+    """Headers 형식 검증 (-H / --header 값 목록)"""
+    errors = []
+
+    for header in headers:
+        # Header는 "Key: Value" 형식이어야 함
+        if ":" not in header:
+            errors.append(f"잘못된 헤더 형식: {header} (Key: Value 형식이어야 합니다)")
+
+    return len(errors) == 0, errors
+
+
+def _validate_body(body: Optional[str]) -> Tuple[bool, List[str]]:
+    """Request body 형식 검증"""
+    # Body가 있으면 기본적으로 유효 (JSON 파싱은 하지 않음)
+    # 플레이스홀더나 실제 데이터 모두 허용
+    return True, []
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _validate_and_parse(curl_command: str) -> Tuple[bool, Tuple[str, ...], CurlComponents]:
+    """cURL 명령어 검증 + 구성 요소 분해 (명령어 문자열별로 캐시)
+
+    캐시된 결과를 여러 호출자가 공유하므로 오류는 tuple, 구성 요소는 불변 CurlComponents로 반환합니다.
+    """
+    # 옵션 스캔 (한 번의 패스, 나온 순서대로, 옵션 표시 "-"가 없으면 생략)
+    method_matches = []
+    header_matches = []
+    body = None
+    options = _OPTION_RE.finditer(curl_command) if "-" in curl_command else ()
+    for match in options:
+        name = match.lastgroup
+        kind = _OPTION_KINDS[name]
+        if kind == "method":
+            method_matches.append(match.group(name))
+        elif kind == "header":
+            header_matches.append(match.group(name))
+        elif body is None:
+            body = match.group(name)  # 첫 번째 body만 사용
+    # URL 스캔 (우선순위 선택이 필요해 별도 패스)
+    url = _find_url(curl_command)
+
+    components = CurlComponents(
+        method=method_matches[0].upper() if method_matches else "GET",  # 기본값 GET
+        url=url,
+        headers=tuple(header_matches),
+        body=body,
+        # 헤더 이름은 파싱 시 한 번만 소문자로 정규화 (검증기는 집합 조회만 수행)
+        header_names=frozenset(h.split(":", 1)[0].strip().lower() for h in header_matches),
+    )
+
+    errors = []
+
+    # 1. curl 명령어로 시작하는지 확인
+    if not _starts_with_curl(curl_command):
+        errors.append("명령어가 'curl'로 시작하지 않습니다")
+        return False, tuple(errors), components
+
+    # 2. HTTP 메서드 검증
+    method_valid, method_errors = _validate_method(method_matches)
+    errors.extend(method_errors)
+
+    # 3. URL 존재 확인
+    url_valid, url_errors = _validate_url(url)
+    errors.extend(url_errors)
+
+    # 4. Headers 형식 검증
+    headers_valid, header_errors = _validate_headers(components.headers)
+    errors.extend(header_errors)
+
+    # 5. Request body 형식 검증
+    body_valid, body_errors = _validate_body(body)
+    errors.extend(body_errors)
+
+    is_valid = len(errors) == 0
+    return is_valid, tuple(errors), components
 
 
 class CurlValidator:
     """cURL 명령어의 문법적 유효성을 검증"""
 
+    # 상태가 없으므로 인스턴스 딕셔너리를 만들지 않음
+    __slots__ = ()
+
     # 지원되는 HTTP 메서드
-    VALID_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+    VALID_METHODS = _VALID_METHODS
 
     def __init__(self):
         """CurlValidator 초기화"""
@@ -26,109 +193,43 @@ class CurlValidator:
         Returns:
             Tuple[bool, List[str]]: (유효 여부, 오류 메시지 리스트)
         """
-        errors = []
-
-        # 1. curl 명령어로 시작하는지 확인
-        if not self._starts_with_curl(curl_command):
-            errors.append("명령어가 'curl'로 시작하지 않습니다")
-            return False, errors
-
-        # 2. HTTP 메서드 검증
-        method_valid, method_errors = self._validate_method(curl_command)
-        errors.extend(method_errors)
-
-        # 3. URL 존재 확인
-        url_valid, url_errors = self._validate_url(curl_command)
-        errors.extend(url_errors)
-
-        # 4. Headers 형식 검증
-        headers_valid, header_errors = self._validate_headers(curl_command)
-        errors.extend(header_errors)
-
-        # 5. Request body 형식 검증
-        body_valid, body_errors = self._validate_body(curl_command)
-        errors.extend(body_errors)
-
-        is_valid = len(errors) == 0
-        return is_valid, errors
-
-    def _starts_with_curl(self, command: str) -> bool:
-        """curl로 시작하는지 확인"""
-        stripped = command.strip()
-        return stripped.startswith("curl ")
-
-    def _validate_method(self, command: str) -> Tuple[bool, List[str]]:
-        """HTTP 메서드 검증"""
-        errors = []
-
-        # -X 또는 --request 옵션 찾기
-        method_pattern = r"-X\s+(\w+)|--request\s+(\w+)"
-        matches = re.findall(method_pattern, command)
-
-        if not matches:
-            # 메서드가 명시되지 않았으면 기본값 GET (valid)
-            return True, []
+        is_valid, errors, _ = _validate_and_parse(curl_command)
+        return is_valid, list(errors)
 
-        # 모든 매치에서 메서드 추출
-        for match in matches:
-            method = match[0] or match[1]
-            if method.upper() not in self.VALID_METHODS:
-                errors.append(f"지원되지 않는 HTTP 메서드: {method}")
-
-        return len(errors) == 0, errors
-
-    def _validate_url(self, command: str) -> Tuple[bool, List[str]]:
-        """URL 존재 확인"""
-        errors = []
-
-        # URL 패턴: http(s)://... 또는 플레이스홀더
-        url_patterns = [
-            r"https?://\S+",  # 실제 URL
-            r"<[A-Z_]+>",  # 플레이스홀더 (예: <BASE_URL>)
-            r"\$\{[A-Z_]+\}",  # 환경변수 (예: ${BASE_URL})
-        ]
-
-        found_url = False
-        for pattern in url_patterns:
-            if re.search(pattern, command):
-                found_url = True
-                break
-
-        if not found_url:
-            errors.append("URL이 명시되지 않았습니다")
-
-        return found_url, errors
-
-    def _validate_headers(self, command: str) -> Tuple[bool, List[str]]:
-        """Headers 형식 검증"""
-        errors = []
+    def validate_batch(self, curl_commands: List[str]) -> List[Tuple[bool, List[str]]]:
+        """
+        여러 cURL 명령어 문법 검증
 
-        # -H 또는 --header 옵션 찾기
-        header_pattern = r'-H\s+"([^"]+)"|--header\s+"([^"]+)"'
-        matches = re.findall(header_pattern, command)
+        표준 re는 매칭 중 GIL을 해제하지 않아 스레드 풀로 나눠도 빨라지지 않으므로 순차로 검증합니다.
+        같은 명령어는 검증 캐시를 공유하므로 한 번만 스캔합니다.
 
-        for match in matches:
-            header = match[0] or match[1]
-            # Header는 "Key: Value" 형식이어야 함
-            if ":" not in header:
-                errors.append(f"잘못된 헤더 형식: {header} (Key: Value 형식이어야 합니다)")
+        Args:
+            curl_commands: 검증할 cURL 명령어 리스트
 
-        return len(errors) == 0, errors
+        Returns:
+            List[Tuple[bool, List[str]]]: 명령어별 (유효 여부, 오류 메시지 리스트), 입력 순서 유지
+        """
+        return [self.validate(curl_command) for curl_command in curl_commands]
 
-    def _validate_body(self, command: str) -> Tuple[bool, List[str]]:
-        """Request body 형식 검증"""
-        errors = []
+    def validate_and_parse(
+        self,
+        curl_command: str
+    ) -> Tuple[bool, Tuple[str, ...], CurlComponents]:
+        """
+        cURL 명령어 문법 검증과 구성 요소 분해를 한 번에 수행
 
-        # -d, --data, --data-raw 옵션 찾기
-        body_pattern = r'-d\s+"([^"]+)"|--data\s+"([^"]+)"|--data-raw\s+"([^"]+)"'
-        matches = re.findall(body_pattern, command)
+        각 정규식은 명령어 전체를 한 번씩만 스캔하고, 그 결과로 오류와 구성 요소를 함께 만듭니다.
+        같은 명령어는 캐시된 결과를 그대로 반환하므로 결과는 수정할 수 없는 형태입니다.
 
-        # Body가 있으면 기본적으로 유효 (JSON 파싱은 하지 않음)
-        # 플레이스홀더나 실제 데이터 모두 허용
+        Args:
+            curl_command: 검증할 cURL 명령어
 
-        return True, errors
+        Returns:
+            Tuple[bool, Tuple[str, ...], CurlComponents]: (유효 여부, 오류 메시지, 구성 요소)
+        """
+        return _validate_and_parse(curl_command)
 
-    def get_curl_components(self, curl_command: str) -> dict:
+    def get_curl_components(self, curl_command: str) -> CurlComponents:
         """
         cURL 명령어를 구성 요소로 분해
 
@@ -136,44 +237,19 @@ class CurlValidator:
             curl_command: cURL 명령어
 
         Returns:
-            dict: method, url, headers, body 등의 구성 요소
+            CurlComponents: method, url, headers, body 구성 요소
         """
-        components = {
-            "method": None,
-            "url": None,
-            "headers": [],
-            "body": None,
-        }
-
-        # Method 추출
-        method_pattern = r"-X\s+(\w+)|--request\s+(\w+)"
-        method_match = re.search(method_pattern, curl_command)
-        if method_match:
-            components["method"] = (method_match.group(1) or method_match.group(2)).upper()
-        else:
-            components["method"] = "GET"  # 기본값
-
-        # URL 추출
-        url_patterns = [
-            r"(https?://\S+)",
-            r"(<[A-Z_]+>(?:/\S*)?)",
-            r"(\$\{[A-Z_]+\}(?:/\S*)?)",
-        ]
-        for pattern in url_patterns:
-            url_match = re.search(pattern, curl_command)
-            if url_match:
-                components["url"] = url_match.group(1)
-                break
-
-        # Headers 추출
-        header_pattern = r'-H\s+"([^"]+)"|--header\s+"([^"]+)"'
-        header_matches = re.findall(header_pattern, curl_command)
-        components["headers"] = [match[0] or match[1] for match in header_matches]
-
-        # Body 추출
-        body_pattern = r'-d\s+"([^"]+)"|--data\s+"([^"]+)"|--data-raw\s+"([^"]+)"'
-        body_match = re.search(body_pattern, curl_command)
-        if body_match:
-            components["body"] = body_match.group(1) or body_match.group(2) or body_match.group(3)
-
-        return components
+        return _validate_and_parse(curl_command)[2]
+
+
+# 상태가 없는 검증기라 요청마다 만들지 않고 하나를 공유
+_default_validator = CurlValidator()
+
+
+def get_curl_validator() -> CurlValidator:
+    """공유 cURL 문법 검증기 반환
+
+    Returns:
+        CurlValidator: 모듈 수준 싱글톤 검증기
+    """
+    return _default_validator
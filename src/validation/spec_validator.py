@@ -1,26 +1,35 @@
 """API 명세서 준수 검증 모듈"""
 
-import re
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 
-from src.core.models import EndpointChunk
+from src.core.models import CurlComponents, EndpointChunk
+from src.validation import _regex
+
+# 파라미터 이름 토큰 (식별자 + 하이픈, 예: payment_id, X-Request-Id)
+_TOKEN_RE = _regex.compile_pattern(r"[A-Za-z_][A-Za-z0-9_\-]*")
+
+# 플레이스홀더 이름 (예: <PAYMENT_ID>, ${PAYMENT_ID})
+_PLACEHOLDER_RE = _regex.compile_pattern(r"<([^<>]+)>|\$\{([^{}]+)\}")
 
 
 class SpecValidator:
     """생성된 cURL 명령어가 API 명세서를 준수하는지 검증"""
 
+    # 상태가 없으므로 인스턴스 딕셔너리를 만들지 않음
+    __slots__ = ()
+
     def __init__(self):
         """SpecValidator 초기화"""
         pass
 
     def validate(
-        self, curl_components: Dict, endpoint_chunk: EndpointChunk
+        self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk
     ) -> Tuple[bool, List[str], float]:
         """
         cURL이 명세서를 준수하는지 검증
 
         Args:
-            curl_components: CurlValidator.get_curl_components() 결과
+            curl_components: CurlValidator.get_curl_components() 결과 (CurlComponents)
             endpoint_chunk: 검색된 엔드포인트 청크
 
         Returns:
@@ -33,7 +42,7 @@ class SpecValidator:
         method_match = self._validate_method(curl_components, endpoint_chunk)
         if not method_match:
             warnings.append(
-                f"HTTP 메서드 불일치: cURL={curl_components['method']}, "
+                f"HTTP 메서드 불일치: cURL={curl_components.method}, "
                 f"명세={endpoint_chunk.metadata.method}"
             )
         else:
@@ -69,55 +78,46 @@ class SpecValidator:
         is_valid = len(warnings) == 0
         return is_valid, warnings, completeness_score
 
-    def _validate_method(self, curl_components: Dict, endpoint_chunk: EndpointChunk) -> bool:
+    def _validate_method(self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk) -> bool:
         """HTTP 메서드 일치 확인"""
-        curl_method = curl_components.get("method", "GET").upper()
-        spec_method = endpoint_chunk.metadata.method.upper()
-        return curl_method == spec_method
+        curl_method = curl_components.method
+        # 명세 메서드는 메타데이터 생성 시 대문자로 정규화되어 있으므로 cURL 쪽만 필요할 때 변환
+        spec_method = endpoint_chunk.metadata.method
+        return curl_method == spec_method or curl_method.upper() == spec_method
 
-    def _validate_path(self, curl_components: Dict, endpoint_chunk: EndpointChunk) -> bool:
+    def _validate_path(self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk) -> bool:
         """엔드포인트 경로 포함 확인"""
-        url = curl_components.get("url", "")
-        endpoint_path = endpoint_chunk.metadata.endpoint
+        url = curl_components.url
+        metadata = endpoint_chunk.metadata
 
-        # 경로 파라미터 제거 (예: /payment/{id} → /payment/)
-        normalized_path = re.sub(r"\{[^}]+\}", "", endpoint_path)
+        # 경로 파라미터를 제거한 경로 (예: /payment/{id} → /payment/, 메타데이터에 캐시됨)
+        normalized_path = metadata.normalized_endpoint
 
         # URL에 경로가 포함되어 있는지 확인
-        return normalized_path in url or endpoint_path in url
+        return normalized_path in url or metadata.endpoint in url
 
-    def _validate_auth(self, curl_components: Dict, endpoint_chunk: EndpointChunk) -> bool:
+    def _validate_auth(self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk) -> bool:
         """인증 헤더 확인"""
         if not endpoint_chunk.metadata.requires_auth:
             # 인증 불필요하면 통과
             return True
 
-        headers = curl_components.get("headers", [])
         # Authorization 헤더가 있는지 확인
-        for header in headers:
-            if header.lower().startswith("authorization"):
-                return True
+        return "authorization" in curl_components.header_names
 
-        return False
-
-    def _validate_content_type(self, curl_components: Dict, endpoint_chunk: EndpointChunk) -> bool:
+    def _validate_content_type(self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk) -> bool:
         """Content-Type 헤더 확인"""
-        body = curl_components.get("body")
+        body = curl_components.body
         if not body:
             # Body가 없으면 Content-Type 불필요
             return True
 
-        headers = curl_components.get("headers", [])
         # Content-Type 헤더가 있는지 확인
-        for header in headers:
-            if header.lower().startswith("content-type"):
-                return True
-
         # Body가 있는데 Content-Type이 없으면 경고 (하지만 curl은 기본값 사용하므로 치명적이진 않음)
-        return False
+        return "content-type" in curl_components.header_names
 
     def _validate_required_params(
-        self, curl_components: Dict, endpoint_chunk: EndpointChunk
+        self, curl_components: CurlComponents, endpoint_chunk: EndpointChunk
     ) -> float:
         """
         필수 파라미터 포함 여부 확인
@@ -125,13 +125,8 @@ class SpecValidator:
         Returns:
             float: 필수 파라미터 완성도 점수 (0-1)
         """
-        # 필수 파라미터 목록 추출
-        required_params = []
-        if endpoint_chunk.parameters:
-            for param in endpoint_chunk.parameters:
-                if param.required:
-                    required_params.append(param.name)
-
+        # 필수 파라미터 목록 (청크에 캐시됨)
+        required_params = endpoint_chunk.required_param_names
         if not required_params:
             # 필수 파라미터가 없으면 완성도 100%
             return 1.0
@@ -141,27 +136,44 @@ class SpecValidator:
         # - Path params
         # - Headers
         # - Body
-        url = curl_components.get("url", "")
-        headers = curl_components.get("headers", [])
-        body = curl_components.get("body", "")
-
-        # URL + headers + body를 합친 텍스트에서 파라미터 이름 검색
-        combined_text = f"{url} {' '.join(headers)} {body}"
+        url = curl_components.url
+        headers = curl_components.headers
+        body = curl_components.body
+
+        # URL, headers, body를 이어 붙이지 않고 각각 한 번씩만 토큰화해 파라미터마다 O(1)로 확인
+        parts = (url or "", *headers, body or "")
+        tokens = set()
+        placeholders = set()
+        for part in parts:
+            tokens.update(_TOKEN_RE.findall(part))
+            # findall의 (그룹1, 그룹2) 튜플이 finditer의 Match 객체보다 생성 비용이 작음
+            placeholders.update(angle or env for angle, env in _PLACEHOLDER_RE.findall(part))
 
         found_count = 0
         for param_name in required_params:
             # 파라미터 이름 또는 플레이스홀더가 포함되어 있는지 확인
             # 예: payment_id, <PAYMENT_ID>, ${PAYMENT_ID}
-            patterns = [
-                param_name,
-                f"<{param_name.upper()}>",
-                f"${{{param_name.upper()}}}",
-            ]
-            for pattern in patterns:
-                if pattern in combined_text:
-                    found_count += 1
-                    break
+            if _TOKEN_RE.fullmatch(param_name):
+                found = param_name in tokens
+            else:
+                # 토큰 형태가 아닌 이름 (예: filter[name])은 부분 문자열로 검색
+                found = any(param_name in part for part in parts)
+            if found or param_name.upper() in placeholders:
+                found_count += 1
 
         # 완성도 = 발견된 필수 파라미터 수 / 전체 필수 파라미터 수
         completeness = found_count / len(required_params) if required_params else 1.0
         return completeness
+
+
+# 상태가 없는 검증기라 요청마다 만들지 않고 하나를 공유
+_default_validator = SpecValidator()
+
+
+def get_spec_validator() -> SpecValidator:
+    """공유 명세 준수 검증기 반환
+
+    Returns:
+        SpecValidator: 모듈 수준 싱글톤 검증기
+    """
+    return _default_validator
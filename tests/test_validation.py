@@ -0,0 +1,144 @@
+"""Tests for validation module."""
+import pytest
+
+from src.core.models import CurlComponents, EndpointChunk
+from src.validation import CurlValidator, SpecValidator
+
+
+def _chunk(required_names=(), requires_auth=False):
+    """필수 쿼리 파라미터만 가진 GET /a 청크"""
+    return EndpointChunk.model_validate({
+        "chunk_id": "GET_/a",
+        "method": "GET",
+        "path": "/a",
+        "responses": {},
+        "parameters": [{"name": n, "in": "query", "required": True} for n in required_names],
+        "metadata": {"endpoint": "/a", "method": "GET", "requires_auth": requires_auth},
+    })
+
+
+def _components(url="https://api.example.com/a", headers=(), body=None):
+    return CurlComponents(method="GET", url=url, headers=tuple(headers), body=body)
+
+
+@pytest.mark.parametrize(
+    "param_name, components",
+    [
+        # 토큰 일치 (URL, 헤더, 바디)
+        ("page", _components(url="https://api.example.com/a?page=1")),
+        ("X-Request-Id", _components(headers=["X-Request-Id: 1"])),
+        ("payment_id", _components(body='{"payment_id": "p-1"}')),
+        # 플레이스홀더 일치 (이름을 대문자로 쓴 <NAME>, ${NAME})
+        ("payment_id", _components(url="https://api.example.com/a/<PAYMENT_ID>")),
+        ("payment_id", _components(url="https://api.example.com/a/${PAYMENT_ID}")),
+        # 토큰 형태가 아닌 이름은 부분 문자열로 검색
+        ("filter[name]", _components(url="https://api.example.com/a?filter[name]=x")),
+    ],
+)
+def test_required_param_found(param_name, components):
+    """필수 파라미터가 cURL에 있으면 완성도 1.0"""
+    score = SpecValidator()._validate_required_params(components, _chunk([param_name]))
+    assert score == 1.0
+
+
+@pytest.mark.parametrize(
+    "param_name, components",
+    [
+        # 식별자는 토큰 단위로만 일치 ("id"가 "payment_id"의 일부로 잡히지 않음)
+        ("id", _components(body='{"payment_id": "p-1"}')),
+        ("id", _components(url="https://api.example.com/a/<PAYMENT_ID>")),
+        ("page", _components(url="https://api.example.com/a?pages=2")),
+        ("filter[name]", _components(url="https://api.example.com/a?filter=x")),
+        ("amount", _components()),
+    ],
+)
+def test_required_param_missing(param_name, components):
+    """필수 파라미터가 cURL에 없으면 완성도 0.0"""
+    score = SpecValidator()._validate_required_params(components, _chunk([param_name]))
+    assert score == 0.0
+
+
+def test_required_params_partial():
+    """찾은 필수 파라미터 비율을 완성도로 반환"""
+    components = _components(url="https://api.example.com/a?page=1", body='{"size": 10}')
+    score = SpecValidator()._validate_required_params(
+        components, _chunk(["page", "size", "id", "payment_id"])
+    )
+    assert score == 0.5
+
+
+def test_no_required_params():
+    """필수 파라미터가 없으면 완성도 1.0"""
+    assert SpecValidator()._validate_required_params(_components(), _chunk([])) == 1.0
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        # 기본 메서드 GET, 긴 옵션, 소문자 메서드
+        (
+            'curl --request delete ${BASE_URL}/a --header "A: b" --data-raw "x"',
+            CurlComponents(method="DELETE", url="${BASE_URL}/a", headers=("A: b",), body="x"),
+        ),
+        # 이스케이프된 따옴표가 있는 바디/헤더는 값 전체를 추출
+        (
+            'curl -X POST https://a/b -d "{\\"amount\\": 1}"',
+            CurlComponents(method="POST", url="https://a/b", body='{\\"amount\\": 1}'),
+        ),
+        (
+            'curl -H "X-A: \\"q\\"" https://a',
+            CurlComponents(method="GET", url="https://a", headers=('X-A: \\"q\\"',)),
+        ),
+        # 옵션 값 안의 "-X"는 메서드로 보지 않음
+        (
+            'curl -d "{\\"cmd\\": \\"-X PUT\\"}" http://a',
+            CurlComponents(method="GET", url="http://a", body='{\\"cmd\\": \\"-X PUT\\"}'),
+        ),
+        # 빈 바디는 None이 아닌 빈 문자열
+        ('curl -X POST http://a -d ""', CurlComponents(method="POST", url="http://a", body="")),
+        # 따옴표로 감싼 URL은 닫는 따옴표를 포함하지 않음
+        ('curl -X POST "https://a/v1/pay"', CurlComponents(method="POST", url="https://a/v1/pay")),
+        ("curl 'https://a/v1/pay'", CurlComponents(method="GET", url="https://a/v1/pay")),
+        # 실제 URL이 플레이스홀더보다 우선
+        ("curl <BASE_URL>/a https://a/b", CurlComponents(method="GET", url="https://a/b")),
+        # 옵션과 값은 같은 줄에 있어야 함
+        ("curl -X\n POST https://a", CurlComponents(method="GET", url="https://a")),
+    ],
+)
+def test_curl_components(command, expected):
+    """cURL 명령어 구성 요소 추출"""
+    assert CurlValidator().get_curl_components(command) == expected
+
+
+@pytest.mark.parametrize(
+    "command, expected_errors",
+    [
+        ('curl -X POST https://a -H "Content-Type: application/json" -d "{}"', ()),
+        ('curl https://a -H "NoColon"', ("잘못된 헤더 형식: NoColon (Key: Value 형식이어야 합니다)",)),
+        ("curl -X FOO https://a", ("지원되지 않는 HTTP 메서드: FOO",)),
+        ("wget https://a", ("명령어가 'curl'로 시작하지 않습니다",)),
+        ("curl -X GET", ("URL이 명시되지 않았습니다",)),
+    ],
+)
+def test_curl_syntax_errors(command, expected_errors):
+    """cURL 문법 검증 오류 메시지"""
+    is_valid, errors, _ = CurlValidator().validate_and_parse(command)
+    assert is_valid == (not expected_errors)
+    assert errors == expected_errors
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("Authorization: Bearer <TOKEN>", True),
+        ("authorization:Bearer x", True),
+        ("AUTHORIZATION : x", True),
+        # 헤더 이름이 정확히 일치해야 함 (접두사 일치 아님)
+        ("Authorization-X: y", False),
+        ("X-Authorization: y", False),
+    ],
+)
+def test_auth_header_name_match(header, expected):
+    """Authorization 헤더는 대소문자 무시, 이름 전체 일치"""
+    components = CurlValidator().get_curl_components(f'curl https://a/a -H "{header}"')
+    assert SpecValidator()._validate_auth(components, _chunk(requires_auth=True)) is expected